@@ -10,18 +10,22 @@ bl_info = {
 
 import json
 import os
+import queue
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import threading
 import time
-import uuid
-import urllib.error
-import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import bpy
+from bpy.app.handlers import persistent
 from bpy.props import BoolProperty, FloatProperty, StringProperty, PointerProperty
 from bpy.types import AddonPreferences, Operator, Panel
 
@@ -38,6 +42,12 @@ ACTIVE_BLENDER_INFO_FILENAME = "active_blender.json"
 LINKS_FILENAME = "project_links.json"
 PROJECT_META_DIRNAME = ".gob_meta"
 TEMP_DIRNAME = ".gob_temp"
+BRIDGE_INDEX_FILENAME = "bridge_index.json"
+BRIDGE_INDEX_VERSION = 1
+BULK_STAT_CHUNK = 256
+MANIFEST_SKIP_DIRS = frozenset(
+    {TEMP_DIRNAME, ".git", "__pycache__", "node_modules", "autosave", ".autosave"}
+)
 TEMP_SP_PREFIX = "gob_unsaved_sp_"
 TEMP_BLENDER_PREFIX = "gob_unsaved_bl_"
 TEMP_SP_SUFFIX = ".spp"
@@ -48,24 +58,77 @@ UPDATE_URL = (
     "https://raw.githubusercontent.com/CIoudGuy/Blender-to-Substance-Painter-and-back-Gob/"
     "refs/heads/main/version.json"
 )
+UPDATE_CACHE_TTL = 3600.0
+SP_RUNNING_TTL = 2.0
+PATH_EXISTS_TTL = 2.0
+PATH_EXISTS_EVICT_AGE = 30.0
+DIR_SIZE_MEMO_MAX_AGE = 60.0
+CACHE_SIZE_TIMER_INTERVAL = 5.0
+CACHE_SIZE_POLL_TIMEOUT = 120.0
+_CACHE_TTL = (30.0, 5.0)
+SP_PROCESS_NAMES = frozenset({"Adobe Substance 3D Painter.exe", "Substance 3D Painter.exe"})
+TH32CS_SNAPPROCESS = 0x00000002
+UPDATE_ERROR_TTL = 60.0
 
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".tga", ".exr"}
+_IMAGE_EXTS_TUPLE = tuple(sorted(IMAGE_EXTS))
 CACHE_WARN_BYTES = 35 * 1024 ** 3
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_BYTE_UNIT_DIVISORS = tuple(1024.0 ** index for index in range(len(_BYTE_UNITS)))
 DEFAULT_CACHE_LIMIT_GB = 35.0
 UI_LINK_CACHE_TTL = 0.75
+UI_LINK_STATE_MAX_AGE = 5.0
+ACTIVE_BLENDER_HEARTBEAT_INTERVAL = 30.0
+ACTIVE_BLENDER_REFRESH_AGE = 60.0
+_LOW_ID_ROWS = (("gob_sp_low_poly_collection", "Low Collection"),)
+_HIGH_ID_ROWS = _LOW_ID_ROWS + (("gob_sp_high_poly_collection", "High Collection"),)
 _temp_session_id = None
 _temp_blender_file = None
 _last_blender_file = None
+_heartbeat_key = None
+_heartbeat_written_at = float("-inf")
+_SANITIZE_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if not (chr(code).isalnum() or chr(code) in "-_")}
+)
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_-]")
+_TEXSET_PREFIX_RE = re.compile(r"^(?:b2sp|sp2b)[._-]+(.+)$", re.IGNORECASE)
+_MATCH_NAME_RE = re.compile(r"[^a-z0-9]+")
+_VERSION_RE = re.compile(r"\d+")
+_DX_FORMAT_TOKENS = ("directx", "d3d")
+_GL_FORMAT_TOKENS = ("opengl", "ogl")
+_DX_NAME_TOKENS = ("directx", "d3d", "_dx")
+_cache_lock = threading.Lock()
+_update_cache_lock = threading.Lock()
+_update_cache = {"expires": 0.0, "value": None}
+_sp_running_cache = (float("-inf"), False)
+_sp_exe_cache = {}
 _project_dir_cache = {}
+_manifest_cache = {}
+_bridge_indexes = {}
+_bridge_index_session = None
+_bridge_ops_running = 0
+_bridge_pool_executor = None
+_io_queue = queue.Queue()
+_io_worker_thread = None
+_image_memo = {}
+_dir_size_memo = {}
+_active_sp_info_cache = {}
+_path_is_file_cache = {}
+_material_build_cache = {}
+_temp_dir_key_cache = {}
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=True)
 _ui_link_cache = {
     "timestamp": 0.0,
     "blender_file": "",
     "project_dir": "",
+    "project_path": None,
     "active_info": None,
     "auto_sp_project": "",
     "linked_sp_project": "",
     "auto_is_temp": False,
     "auto_exists": False,
+    "link_key": None,
+    "resolved_at": 0.0,
 }
 
 MAP_KEYWORDS = [
@@ -108,6 +171,60 @@ MAP_KEYWORDS = [
     ("nrm", "normal"),
 ]
 
+_SLASH_TRANSLATE = str.maketrans("\\/", "__")
+_MAP_TYPE_RULES = (
+    ("opacity", "opacity", "opacity"),
+    ("alpha", "opacity", "alpha"),
+    ("transparency", "opacity", "transparency"),
+    ("transparent", "opacity", "transparent"),
+    ("cutout", "opacity", "cutout"),
+    (r"(?:^|[._\\-])base(?:$|[._\\-])", "base_color", None),
+    ("materialparam", "orm", "materialparams"),
+    ("maskmap", "orm", "maskmap"),
+    ("occlusionroughnessmetallic", "orm", "occlusionroughnessmetallic"),
+    ("occlusionroughnessmetal", "orm", "occlusionroughnessmetal"),
+    (r"occlusion[._\\-]?roughness[._\\-]?metallic", "orm", None),
+    (r"occlusion[._\\-]?roughness[._\\-]?metal", "orm", None),
+    (r"(?:^|[._\\-])arm(?:$|[._\\-])", "orm", None),
+    (r"(?:^|[._\\-])orm(?:$|[._\\-])", "orm", None),
+    (r"metallic[._\\-]?roughness", "metallic_roughness", None),
+    (r"roughness[._\\-]?metallic", "metallic_roughness", None),
+    (r"metallic[._\\-]?smoothness", "metallic_smoothness", None),
+    (r"specular[._\\-]?smoothness", "specular_smoothness", None),
+    (r"specular[._\\-]?gloss", "specular_smoothness", None),
+    ("specgloss", "specular_smoothness", "specgloss"),
+    (r"mask[._\\-]?map", "mask", None),
+)
+_MAP_TYPE_RE = re.compile(
+    "(?=" + "|".join(f"({pattern})" for pattern, _, _ in _MAP_TYPE_RULES) + ")"
+)
+_MAP_KEYWORD_LOOKUP = {
+    keyword: (index, map_type) for index, (keyword, map_type) in enumerate(MAP_KEYWORDS)
+}
+_MAP_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword, _ in MAP_KEYWORDS) + "))"
+)
+
+MATERIAL_MAP_ORDER = (
+    "base_color",
+    "orm",
+    "metallic_roughness",
+    "metallic_smoothness",
+    "mask",
+    "ao",
+    "metallic",
+    "roughness",
+    "glossiness",
+    "specular_smoothness",
+    "specular",
+    "normal",
+    "height",
+    "opacity",
+    "emission",
+)
+NON_COLOR_MAP_TYPES = frozenset(MATERIAL_MAP_ORDER) - {"base_color", "emission"}
+_EMISSION_SOCKET_NAMES = frozenset({"Emission", "Emission Color"})
+
 DISCORD_INVITE_URL = "https://discord.gg/BE7k9Xxm5z"
 BUG_REPORT_URL = (
     "https://github.com/CIoudGuy/Blender-to-Substance-Painter-and-back-Gob/issues"
@@ -162,13 +279,11 @@ def documents_bridge_root():
 def sanitize_name(name):
     if not name:
         return "untitled"
-    safe = []
-    for ch in name:
-        if ord(ch) < 128 and (ch.isalnum() or ch in "-_"):
-            safe.append(ch)
-        else:
-            safe.append("_")
-    result = "".join(safe).strip("_")
+    if name.isascii():
+        result = name.translate(_SANITIZE_TABLE)
+    else:
+        result = _SANITIZE_RE.sub("_", name)
+    result = result.strip("_")
     return result or "untitled"
 
 
@@ -181,10 +296,17 @@ def normalize_path(path):
         return str(path)
 
 
-def normalize_path_key(path):
+@lru_cache(maxsize=1024)
+def _normalized_path_key(path):
     return normalize_path(path).lower()
 
 
+def normalize_path_key(path):
+    if not path:
+        return ""
+    return _normalized_path_key(str(path))
+
+
 def temp_session_id():
     global _temp_session_id
     if _temp_session_id is None:
@@ -228,18 +350,30 @@ def get_blender_file_path_or_temp(prefs=None):
     return temp_blender_file_path(prefs)
 
 
+def bridge_temp_dir_key(prefs=None):
+    bridge_dir = prefs.bridge_dir if prefs else ""
+    cache_key = (os.environ.get(BRIDGE_ENV_VAR) or "", bridge_dir or "")
+    cached = _temp_dir_key_cache.get(cache_key)
+    if cached is None:
+        cached = normalize_path(bridge_temp_dir(prefs)).lower()
+        with _cache_lock:
+            _temp_dir_key_cache[cache_key] = cached
+    return cached
+
+
 def is_temp_file(path, prefix, suffix, prefs=None):
     if not path:
         return False
     try:
-        path_obj = Path(path)
-    except Exception:
+        path_str = os.fspath(path)
+    except TypeError:
         return False
-    name = path_obj.name.lower()
+    name = os.path.basename(path_str).lower()
     if not (name.startswith(prefix) and name.endswith(suffix)):
         return False
     try:
-        return normalize_path(path_obj.parent).lower() == normalize_path(bridge_temp_dir(prefs)).lower()
+        parent = os.path.dirname(path_str) or "."
+        return normalize_path(parent).lower() == bridge_temp_dir_key(prefs)
     except Exception:
         return False
 
@@ -252,8 +386,22 @@ def is_temp_sp_project_file(path, prefs=None):
     return is_temp_file(path, TEMP_SP_PREFIX, TEMP_SP_SUFFIX, prefs)
 
 
+def _classify_sp_project(path, prefs=None):
+    if is_temp_sp_project_file(path, prefs):
+        return True, False
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False, False
+    return False, stat.S_ISREG(st.st_mode)
+
+
+def _as_path(value):
+    return value if isinstance(value, Path) else Path(value)
+
+
 def project_meta_dir(project_dir):
-    return Path(project_dir) / PROJECT_META_DIRNAME
+    return _as_path(project_dir) / PROJECT_META_DIRNAME
 
 
 def project_manifest_path(project_dir):
@@ -265,17 +413,18 @@ def project_manifest_path(project_dir):
 def legacy_project_manifest_path(project_dir):
     if not project_dir:
         return None
-    return Path(project_dir) / MANIFEST_FILENAME
+    return _as_path(project_dir) / MANIFEST_FILENAME
 
 
 def find_project_manifest_path(project_dir):
     if not project_dir:
         return None
-    new_path = project_manifest_path(project_dir)
-    if new_path and new_path.exists():
+    project_path = _as_path(project_dir)
+    new_path = project_path / PROJECT_META_DIRNAME / MANIFEST_FILENAME
+    if new_path.exists():
         return new_path
-    legacy_path = legacy_project_manifest_path(project_dir)
-    if legacy_path and legacy_path.exists():
+    legacy_path = project_path / MANIFEST_FILENAME
+    if legacy_path.exists():
         return legacy_path
     return new_path
 
@@ -283,10 +432,10 @@ def find_project_manifest_path(project_dir):
 def project_dir_from_manifest_path(manifest_path):
     if not manifest_path:
         return None
-    path = Path(manifest_path)
-    if path.parent.name == PROJECT_META_DIRNAME:
-        return path.parent.parent
-    return path.parent
+    parent = os.path.dirname(os.fspath(manifest_path))
+    if os.path.basename(parent) == PROJECT_META_DIRNAME:
+        parent = os.path.dirname(parent)
+    return Path(parent)
 
 
 def project_dir_cache_key(blender_file):
@@ -299,15 +448,15 @@ def cached_project_dir(blender_file):
     key = project_dir_cache_key(blender_file)
     if not key:
         return None
-    cached = _project_dir_cache.get(key)
-    return Path(cached) if cached else None
+    return _project_dir_cache.get(key)
 
 
 def set_cached_project_dir(blender_file, project_dir):
     key = project_dir_cache_key(blender_file)
     if not key or not project_dir:
         return
-    _project_dir_cache[key] = str(project_dir)
+    with _cache_lock:
+        _project_dir_cache[key] = _as_path(project_dir)
 
 
 def manifest_matches_blender_file(manifest, blender_file):
@@ -317,6 +466,31 @@ def manifest_matches_blender_file(manifest, blender_file):
     return bool(manifest_bl and paths_match(manifest_bl, blender_file))
 
 
+def _manifest_needle(path):
+    name = os.path.basename(normalize_path(path)).lower()
+    if not name or not name.isascii():
+        return None
+    return json.dumps(name)[1:-1].encode("ascii")
+
+
+def manifest_mentions(path, needle):
+    try:
+        with open(path, "rb") as handle:
+            return needle in handle.read().lower()
+    except OSError:
+        return False
+
+
+def project_manifest_matches_blender_file(project_dir, blender_file):
+    manifest_path = find_project_manifest_path(project_dir)
+    if not manifest_path or not manifest_path.exists():
+        return False
+    needle = _manifest_needle(blender_file)
+    if needle and not manifest_mentions(manifest_path, needle):
+        return False
+    return manifest_matches_blender_file(read_manifest(manifest_path), blender_file)
+
+
 def resolve_project_dir_for_blender(context, prefs, blender_file):
     cached = cached_project_dir(blender_file)
     if cached:
@@ -328,9 +502,7 @@ def resolve_project_dir_for_blender(context, prefs, blender_file):
             return linked_dir
     base_dir = get_bridge_root(prefs) / get_project_name(context)
     if blender_file and base_dir.exists():
-        manifest_path = find_project_manifest_path(base_dir)
-        manifest = read_manifest(manifest_path) if manifest_path and manifest_path.exists() else None
-        if manifest_matches_blender_file(manifest, blender_file):
+        if project_manifest_matches_blender_file(base_dir, blender_file):
             set_cached_project_dir(blender_file, base_dir)
             return base_dir
     if blender_file:
@@ -351,22 +523,16 @@ def resolve_project_dir_for_blender(context, prefs, blender_file):
 def unique_project_dir(base_dir, blender_file, prefs):
     if not base_dir.exists():
         return base_dir
-    if blender_file:
-        manifest_path = find_project_manifest_path(base_dir)
-        manifest = read_manifest(manifest_path) if manifest_path and manifest_path.exists() else None
-        if manifest_matches_blender_file(manifest, blender_file):
-            return base_dir
+    if blender_file and project_manifest_matches_blender_file(base_dir, blender_file):
+        return base_dir
     root = base_dir.parent
     base_name = base_dir.name
     index = 1
     while True:
         candidate = root / f"{base_name}{index}"
         if candidate.exists():
-            if blender_file:
-                manifest_path = find_project_manifest_path(candidate)
-                manifest = read_manifest(manifest_path) if manifest_path and manifest_path.exists() else None
-                if manifest_matches_blender_file(manifest, blender_file):
-                    return candidate
+            if blender_file and project_manifest_matches_blender_file(candidate, blender_file):
+                return candidate
             index += 1
             continue
         return candidate
@@ -396,29 +562,28 @@ def project_dir_for_send(context, prefs, blender_file):
     return project_dir
 
 
+def _dedupe_paths(paths):
+    unique = {}
+    for path in paths:
+        unique.setdefault(str(path).lower(), path)
+    return list(unique.values())
+
+
 def link_registry_paths(prefs=None):
     roots = []
     docs_root = documents_bridge_root()
     if docs_root:
-        roots.append(Path(docs_root))
+        roots.append(_as_path(docs_root))
     for root in get_candidate_bridge_roots(prefs):
         if not root:
             continue
         try:
-            root_path = Path(root)
+            root_path = _as_path(root)
         except TypeError:
             continue
         if root_path.exists():
             roots.append(root_path)
-    unique = []
-    seen = set()
-    for root in roots:
-        key = str(root).lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(root)
-    return [root / LINKS_FILENAME for root in unique]
+    return [root / LINKS_FILENAME for root in _dedupe_paths(roots)]
 
 
 def load_link_registry(prefs=None):
@@ -442,16 +607,14 @@ def save_link_registry(data, prefs=None):
     primary = paths[0]
     ensure_dir(primary.parent)
     try:
-        with open(primary, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, ensure_ascii=True)
+        _atomic_write_json(primary, data)
     except OSError:
         return
     for path in paths[1:]:
         if not path.exists():
             continue
         try:
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, ensure_ascii=True)
+            _atomic_write_json(path, data)
         except OSError:
             continue
 
@@ -478,22 +641,39 @@ def update_link_registry(sp_project_file=None, blender_file=None, prefs=None):
 def paths_match(left, right):
     if not left or not right:
         return False
-    return normalize_path(left).lower() == normalize_path(right).lower()
+    return normalize_path_key(left) == normalize_path_key(right)
 
 
+@lru_cache(maxsize=16)
 def parse_suffixes(text):
     if not text:
-        return []
+        return ()
     parts = [part.strip().lower() for part in text.split(",")]
-    return [part for part in parts if part]
+    return tuple(part for part in parts if part)
 
 
-def is_name_with_suffix(name, suffixes):
-    lname = name.lower()
+@lru_cache(maxsize=16)
+def _suffix_tails(suffixes):
+    tails = []
     for suffix in suffixes:
-        if lname.endswith(suffix):
-            return True
-    return False
+        if not suffix.startswith("_") or "_" in suffix[1:]:
+            return None
+        tails.append(suffix[1:])
+    return frozenset(tails)
+
+
+def _lower_name_has_suffix(lname, suffixes):
+    tails = _suffix_tails(suffixes)
+    if tails is None:
+        return lname.endswith(suffixes)
+    _head, sep, tail = lname.rpartition("_")
+    return bool(sep) and tail in tails
+
+
+def is_name_with_suffix(name, suffixes):
+    if not isinstance(suffixes, tuple):
+        suffixes = tuple(suffixes)
+    return _lower_name_has_suffix(name.lower(), suffixes)
 
 
 def collection_in_scene(scene, collection):
@@ -513,13 +693,34 @@ def _scene_collection_poll(scene, collection):
     return collection_in_scene(scene, collection)
 
 
-def _find_layer_collections(layer_collection, target_collection, results):
-    if not layer_collection or not target_collection:
-        return
-    if layer_collection.collection == target_collection:
-        results.append(layer_collection)
-    for child in layer_collection.children:
-        _find_layer_collections(child, target_collection, results)
+_HIDE_ATTRS = ("hide_viewport", "hide_render", "hide_select")
+_LAYER_HIDE_ATTRS = ("exclude", "hide_viewport")
+
+
+def _force_attrs(target, attrs, value):
+    for attr in attrs:
+        try:
+            setattr(target, attr, value)
+        except Exception:
+            pass
+
+
+def _restore_attrs(target, attrs, values):
+    for attr, value in zip(attrs, values):
+        try:
+            setattr(target, attr, value)
+        except Exception:
+            pass
+
+
+def _layer_collection_index(layer_collection):
+    index = {}
+    stack = [layer_collection] if layer_collection else []
+    while stack:
+        layer = stack.pop()
+        index.setdefault(layer.collection.as_pointer(), []).append(layer)
+        stack.extend(reversed(layer.children))
+    return index
 
 
 def collect_collection_meshes(collection, selected_only=False, selected_names=None):
@@ -543,7 +744,21 @@ def collect_collection_meshes(collection, selected_only=False, selected_names=No
     return results
 
 
-def collect_low_poly_objects(context, prefs):
+def scene_mesh_index(scene):
+    meshes = [obj for obj in scene.objects if obj.type == "MESH"]
+    return {
+        "meshes": meshes,
+        "positions": {obj.name: idx for idx, obj in enumerate(meshes)},
+    }
+
+
+def scene_meshes(context, mesh_index=None):
+    if mesh_index is None:
+        return [obj for obj in context.scene.objects if obj.type == "MESH"]
+    return mesh_index["meshes"]
+
+
+def collect_low_poly_objects(context, prefs, mesh_index=None):
     scene = context.scene
     selected_only = bool(prefs and getattr(prefs, "export_selected_only", False))
     selected_names = None
@@ -563,16 +778,16 @@ def collect_low_poly_objects(context, prefs):
         if collection_meshes:
             return collection_meshes
     suffixes = parse_suffixes(getattr(prefs, "low_poly_suffixes", ""))
-    search_pool = context.selected_objects if selected_only else context.scene.objects
     if suffixes:
-        candidates = [
-            obj for obj in search_pool
-            if obj.type == "MESH" and is_name_with_suffix(obj.name, suffixes)
-        ]
+        if selected_only:
+            search_pool = [obj for obj in context.selected_objects if obj.type == "MESH"]
+        else:
+            search_pool = scene_meshes(context, mesh_index)
+        candidates = [obj for obj in search_pool if is_name_with_suffix(obj.name, suffixes)]
         if candidates:
             return candidates
         if selected_only:
-            return [obj for obj in search_pool if obj.type == "MESH"]
+            return search_pool
     return [obj for obj in context.selected_objects if obj.type == "MESH"]
 
 
@@ -597,8 +812,9 @@ def get_project_name(context):
     return "untitled"
 
 
-def get_project_dir(context, prefs):
-    blender_file = get_blender_file_path_or_temp(prefs)
+def get_project_dir(context, prefs, blender_file=None):
+    if blender_file is None:
+        blender_file = get_blender_file_path_or_temp(prefs)
     return resolve_project_dir_for_blender(context, prefs, blender_file)
 
 
@@ -609,9 +825,7 @@ def get_project_dir_fast(context, prefs):
         return cached
     base_dir = get_bridge_root(prefs) / get_project_name(context)
     if blender_file and base_dir.exists():
-        manifest_path = find_project_manifest_path(base_dir)
-        manifest = read_manifest(manifest_path) if manifest_path and manifest_path.exists() else None
-        if manifest_matches_blender_file(manifest, blender_file):
+        if project_manifest_matches_blender_file(base_dir, blender_file):
             set_cached_project_dir(blender_file, base_dir)
             return base_dir
     return base_dir
@@ -628,7 +842,7 @@ def shared_bridge_root_hint_path():
 def read_bridge_root_hint(path):
     if not path:
         return None
-    path = Path(path)
+    path = _as_path(path)
     if not path.exists():
         return None
     try:
@@ -652,8 +866,7 @@ def write_bridge_root_hint(root_path):
     for hint_path in hint_paths:
         try:
             ensure_dir(hint_path.parent)
-            with open(hint_path, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, ensure_ascii=True)
+            _atomic_write_json(hint_path, payload)
         except OSError:
             continue
 
@@ -661,12 +874,27 @@ def write_bridge_root_hint(root_path):
 
 
 def ensure_dir(path):
-    Path(path).mkdir(parents=True, exist_ok=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def _atomic_write_json(path, data):
+    path = os.fspath(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            handle.write(_JSON_ENCODER.encode(data))
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
 
 
 def write_manifest(path, data):
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
+    _atomic_write_json(path, data)
+    _invalidate_dir_size(os.path.dirname(os.fspath(path)))
 
 
 def read_manifest(path):
@@ -678,6 +906,24 @@ def read_manifest(path):
 
 
 def read_active_sp_info(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = normalize_path_key(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _active_sp_info_cache.get(key)
+    if cached and cached[0] == signature:
+        info = cached[1]
+    else:
+        info = _parse_active_sp_info(path, st)
+        with _cache_lock:
+            _active_sp_info_cache[key] = (signature, info)
+    return dict(info) if info else None
+
+
+def _parse_active_sp_info(path, st):
     try:
         with open(path, "r", encoding="utf-8") as handle:
             data = json.load(handle)
@@ -696,10 +942,7 @@ def read_active_sp_info(path):
     except (TypeError, ValueError):
         timestamp = 0.0
     if not timestamp:
-        try:
-            timestamp = Path(path).stat().st_mtime
-        except OSError:
-            timestamp = 0.0
+        timestamp = st.st_mtime
     return {
         "project_dir": Path(project_dir),
         "project_name": data.get("project_name"),
@@ -709,14 +952,29 @@ def read_active_sp_info(path):
     }
 
 
+def _cached_is_file(path, ttl=PATH_EXISTS_TTL):
+    key = str(path)
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _path_is_file_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    exists = os.path.isfile(key)
+    with _cache_lock:
+        if len(_path_is_file_cache) > 64:
+            for stale_key, (checked_at, _) in list(_path_is_file_cache.items()):
+                if now - checked_at > PATH_EXISTS_EVICT_AGE:
+                    del _path_is_file_cache[stale_key]
+        _path_is_file_cache[key] = (now, exists)
+    return exists
+
+
 def find_active_sp_project_info(prefs, max_age=ACTIVE_SP_INFO_MAX_AGE):
     now = time.time()
     best = None
     best_time = 0.0
     for root in get_candidate_bridge_roots(prefs):
-        candidate = Path(root) / ACTIVE_SP_INFO_FILENAME
-        if not candidate.exists():
-            continue
+        candidate = _as_path(root) / ACTIVE_SP_INFO_FILENAME
         info = read_active_sp_info(candidate)
         if not info:
             continue
@@ -733,49 +991,42 @@ def active_blender_info_paths(prefs=None, project_dir=None):
     roots = []
     docs_root = documents_bridge_root()
     if docs_root:
-        roots.append(Path(docs_root))
+        roots.append(_as_path(docs_root))
     for root in get_candidate_bridge_roots(prefs):
         if not root:
             continue
         try:
-            root_path = Path(root)
+            root_path = _as_path(root)
         except TypeError:
             continue
         roots.append(root_path)
     if project_dir:
         roots.append(project_meta_dir(project_dir))
-    unique = []
-    seen = set()
-    for root in roots:
-        key = str(root).lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(root / ACTIVE_BLENDER_INFO_FILENAME)
-    return unique
+    return [root / ACTIVE_BLENDER_INFO_FILENAME for root in _dedupe_paths(roots)]
 
 
-def write_active_blender_info(context=None, prefs=None):
+def write_active_blender_info(context=None, prefs=None, blender_file=None, project_dir=None):
     if context is None:
         context = bpy.context
     if context is None:
         return
     prefs = prefs or get_prefs(context)
-    project_dir = get_project_dir(context, prefs)
+    if blender_file is None:
+        blender_file = get_blender_file_path_or_temp(prefs)
+    if project_dir is None:
+        project_dir = get_project_dir(context, prefs, blender_file)
     info = {
         "timestamp": time.time(),
         "project_open": True,
         "project_name": get_project_name(context),
         "project_dir": str(project_dir),
     }
-    blender_file = get_blender_file_path_or_temp(prefs)
     if blender_file:
         info["blender_file"] = blender_file
     for path in active_blender_info_paths(prefs, project_dir):
         try:
             ensure_dir(path.parent)
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(info, handle, indent=2, ensure_ascii=True)
+            _atomic_write_json(path, info)
         except OSError:
             continue
 
@@ -854,8 +1105,29 @@ def _update_active_blender_info(_context=None):
 
 
 def _active_blender_heartbeat():
+    global _heartbeat_key
+    global _heartbeat_written_at
+    try:
+        context = bpy.context
+        prefs = get_prefs(context) if context else None
+        key = (
+            bpy.data.filepath,
+            get_project_name(context) if context else "",
+            prefs.bridge_dir if prefs else "",
+        )
+    except Exception:
+        key = None
+    now = time.monotonic()
+    if (
+        key is not None
+        and key == _heartbeat_key
+        and now - _heartbeat_written_at < ACTIVE_BLENDER_REFRESH_AGE
+    ):
+        return ACTIVE_BLENDER_HEARTBEAT_INTERVAL
     _update_active_blender_info()
-    return 30.0
+    _heartbeat_key = key
+    _heartbeat_written_at = now
+    return ACTIVE_BLENDER_HEARTBEAT_INTERVAL
 
 
 def get_candidate_bridge_roots(prefs):
@@ -884,90 +1156,402 @@ def get_candidate_bridge_roots(prefs):
         env = os.environ.get(var)
         if env:
             roots.append(Path(env) / "Documents" / "GoB_SP_Bridge")
-    unique = []
-    seen = set()
-    for root in roots:
-        key = str(root).lower()
-        if key in seen:
+    return _dedupe_paths(roots)
+
+
+def _bridge_index_path(root):
+    return os.path.join(root, TEMP_DIRNAME, BRIDGE_INDEX_FILENAME)
+
+
+def load_bridge_index(root):
+    root = os.fspath(root)
+    data = read_manifest(_bridge_index_path(root))
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != BRIDGE_INDEX_VERSION
+        or data.get("root") != root
+        or not isinstance(data.get("dirs"), dict)
+        or not isinstance(data.get("manifests"), dict)
+    ):
+        return None
+    return data
+
+
+def save_bridge_index(root, index):
+    path = _bridge_index_path(os.fspath(root))
+    try:
+        ensure_dir(os.path.dirname(path))
+        _atomic_write_json(path, index)
+    except OSError:
+        return
+
+
+def _index_manifest(manifests, path, st):
+    entry = read_manifest_cached(path, st)
+    if entry:
+        manifest, blender_key, sp_key = entry
+        source = manifest.get("source")
+    else:
+        source, blender_key, sp_key = None, "", ""
+    manifests[path] = [st.st_mtime_ns, st.st_size, source, blender_key, sp_key]
+
+
+def _walk_bridge_tree(top, top_mtime, index, stats):
+    dirs = index["dirs"]
+    manifests = index["manifests"]
+    normcase = os.path.normcase
+    stack = [(top, top_mtime)]
+    while stack:
+        current, mtime = stack.pop()
+        dirs[current] = mtime
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in MANIFEST_SKIP_DIRS:
+                                child_mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                                stack.append((entry.path, child_mtime))
+                        elif normcase(entry.name) == MANIFEST_FILENAME:
+                            st = entry.stat()
+                            stats[entry.path] = st
+                            _index_manifest(manifests, entry.path, st)
+                    except OSError:
+                        continue
+        except OSError:
             continue
-        seen.add(key)
-        unique.append(root)
-    return unique
+
+
+def _purge_bridge_subtree(index, stats, directory):
+    prefix = directory + os.sep
+    for mapping in (index["dirs"], index["manifests"], stats):
+        for path in [path for path in mapping if path == directory or path.startswith(prefix)]:
+            del mapping[path]
+
+
+def _refresh_bridge_index(index, stats):
+    dirs = index["dirs"]
+    manifests = index["manifests"]
+    changed = False
+    stale = []
+    dir_paths = list(dirs)
+    for directory, st in zip(dir_paths, bulk_stat(dir_paths)):
+        current = st.st_mtime_ns if st else None
+        if current != dirs[directory]:
+            stale.append((directory, current))
+    normcase = os.path.normcase
+    for directory, current in sorted(stale):
+        if directory not in dirs:
+            continue
+        changed = True
+        if current is None:
+            _purge_bridge_subtree(index, stats, directory)
+            continue
+        dirs[directory] = current
+        known = {path for path in dirs if os.path.dirname(path) == directory}
+        found = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() in MANIFEST_SKIP_DIRS:
+                                continue
+                            found.add(entry.path)
+                            if entry.path not in dirs:
+                                child_mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                                _walk_bridge_tree(entry.path, child_mtime, index, stats)
+                        elif normcase(entry.name) == MANIFEST_FILENAME:
+                            if entry.path not in manifests:
+                                st = entry.stat()
+                                stats[entry.path] = st
+                                _index_manifest(manifests, entry.path, st)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        for path in known - found:
+            _purge_bridge_subtree(index, stats, path)
+    manifest_paths = list(manifests)
+    for path, st in zip(manifest_paths, bulk_stat(manifest_paths)):
+        record = manifests[path]
+        if st is None:
+            del manifests[path]
+            stats.pop(path, None)
+            changed = True
+            continue
+        stats[path] = st
+        if record[0] != st.st_mtime_ns or record[1] != st.st_size:
+            _index_manifest(manifests, path, st)
+            changed = True
+    return changed
+
+
+def _rebuild_index_maps(index):
+    blender_map = {}
+    sp_map = {}
+    for path, record in index["manifests"].items():
+        if record[3]:
+            blender_map.setdefault(record[3], []).append(path)
+        if record[4]:
+            sp_map.setdefault(record[4], []).append(path)
+    index["blender_to_manifest"] = blender_map
+    index["sp_to_manifest"] = sp_map
+
+
+def bridge_root_index(root):
+    if not root:
+        return None
+    root = os.fspath(root)
+    try:
+        root_mtime = os.stat(root).st_mtime_ns
+    except OSError:
+        return None
+    cached = _bridge_indexes.get(root)
+    if cached:
+        index, stats = cached
+    else:
+        index = load_bridge_index(root)
+        stats = {}
+    if index is None:
+        index = {"version": BRIDGE_INDEX_VERSION, "root": root, "dirs": {}, "manifests": {}}
+        _walk_bridge_tree(root, root_mtime, index, stats)
+        changed = True
+    else:
+        changed = _refresh_bridge_index(index, stats)
+    if changed or "blender_to_manifest" not in index:
+        _rebuild_index_maps(index)
+        save_bridge_index(root, index)
+    with _cache_lock:
+        _bridge_indexes[root] = (index, stats)
+    return index, stats
+
+
+def read_manifest_cached(path, st):
+    cached = _manifest_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    manifest = read_manifest(path)
+    entry = None
+    if isinstance(manifest, dict) and manifest:
+        entry = (
+            manifest,
+            normalize_path_key(get_manifest_blender_file(manifest)),
+            normalize_path_key(get_manifest_sp_project_file(manifest)),
+        )
+    with _cache_lock:
+        _manifest_cache[path] = (st.st_mtime_ns, st.st_size, entry)
+    return entry
+
+
+def _bridge_pool():
+    global _bridge_pool_executor
+    if _bridge_pool_executor is None:
+        with _cache_lock:
+            if _bridge_pool_executor is None:
+                _bridge_pool_executor = ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 4),
+                    thread_name_prefix="gob_bridge",
+                )
+    return _bridge_pool_executor
+
+
+def _shutdown_bridge_pool():
+    global _bridge_pool_executor
+    if _bridge_pool_executor is not None:
+        _bridge_pool_executor.shutdown(wait=False)
+        _bridge_pool_executor = None
+
+
+def _io_worker():
+    while True:
+        job = _io_queue.get()
+        if job is None:
+            return
+        func, args = job
+        try:
+            func(*args)
+        except Exception:
+            pass
+
+
+def _submit_io(func, *args):
+    global _io_worker_thread
+    if _io_worker_thread is None or not _io_worker_thread.is_alive():
+        _io_worker_thread = threading.Thread(target=_io_worker, name="gob_io", daemon=True)
+        _io_worker_thread.start()
+    _io_queue.put((func, args))
+
+
+def _stop_io_worker():
+    global _io_worker_thread
+    if _io_worker_thread is not None:
+        _io_queue.put(None)
+        _io_worker_thread = None
+
+
+def _map_parallel(func, items):
+    items = list(items)
+    if len(items) < 2 or threading.current_thread().name.startswith("gob_bridge"):
+        return [func(item) for item in items]
+    return list(_bridge_pool().map(func, items))
+
+
+def _stat_chunk(paths):
+    results = []
+    for path in paths:
+        try:
+            results.append(os.stat(path))
+        except OSError:
+            results.append(None)
+    return results
+
+
+def bulk_stat(paths):
+    paths = list(paths)
+    if len(paths) < BULK_STAT_CHUNK * 2:
+        return _stat_chunk(paths)
+    chunks = [paths[i:i + BULK_STAT_CHUNK] for i in range(0, len(paths), BULK_STAT_CHUNK)]
+    results = []
+    for chunk in _map_parallel(_stat_chunk, chunks):
+        results.extend(chunk)
+    return results
+
+
+def load_bridge_root_indexes(bridge_roots):
+    session = _bridge_index_session
+    if session is None or threading.current_thread() is not threading.main_thread():
+        return [loaded for loaded in _map_parallel(bridge_root_index, bridge_roots) if loaded]
+    bridge_roots = list(bridge_roots)
+    key = tuple(normalize_path_key(root) for root in bridge_roots)
+    loaded = session.get(key)
+    if loaded is None:
+        loaded = [item for item in _map_parallel(bridge_root_index, bridge_roots) if item]
+        session[key] = loaded
+    return loaded
+
+
+@contextmanager
+def bridge_index_session():
+    global _bridge_index_session
+    if _bridge_index_session is not None:
+        yield
+        return
+    _bridge_index_session = {}
+    try:
+        yield
+    finally:
+        _bridge_index_session = None
+
+
+@contextmanager
+def bridge_operation():
+    global _bridge_ops_running
+    _bridge_ops_running += 1
+    try:
+        yield
+    finally:
+        _bridge_ops_running -= 1
 
 
 def find_latest_manifest(bridge_roots, source=None):
     best_path = None
-    best_time = -1.0
-    for root in bridge_roots:
-        if not root or not root.exists():
-            continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
+    best_time = -1
+    for index, _ in load_bridge_root_indexes(bridge_roots):
+        for candidate, record in index["manifests"].items():
+            if source and record[2] != source:
                 continue
-            if source:
-                manifest = read_manifest(candidate)
-                if not manifest or manifest.get("source") != source:
-                    continue
+            mtime = record[0]
             if mtime > best_time:
                 best_time = mtime
                 best_path = candidate
-    return best_path
+    return Path(best_path) if best_path else None
+
+
+def scan_bridge_roots(
+    bridge_roots,
+    blender_file=None,
+    sp_project_file=None,
+    signature=None,
+    source=None,
+    signature_source="blender",
+    saved_sp=False,
+):
+    result = {
+        "blender_manifest": None,
+        "sp_manifest": None,
+        "signature_manifest": None,
+        "latest_saved_sp": "",
+    }
+    blender_key = normalize_path_key(blender_file) if blender_file else ""
+    sp_key = normalize_path_key(sp_project_file) if sp_project_file else ""
+    if not blender_key and not sp_key:
+        return result
+    want_signature = bool(blender_key and signature)
+    wanted_signature = normalize_mesh_signature(signature) if want_signature else None
+    want_saved_sp = bool(blender_key and saved_sp)
+    best = dict.fromkeys(result, -1)
+    for index, stats in load_bridge_root_indexes(bridge_roots):
+        records = index["manifests"]
+        candidates = []
+        if blender_key:
+            candidates += index["blender_to_manifest"].get(blender_key, [])
+        if sp_key:
+            candidates += index["sp_to_manifest"].get(sp_key, [])
+        for candidate in dict.fromkeys(candidates):
+            record = records.get(candidate)
+            st = stats.get(candidate)
+            if not record or st is None:
+                continue
+            mtime, _, manifest_source, manifest_blender_key, manifest_sp_key = record
+            source_ok = not source or manifest_source == source
+            if sp_key and manifest_sp_key == sp_key and source_ok:
+                if mtime > best["sp_manifest"]:
+                    best["sp_manifest"] = mtime
+                    result["sp_manifest"] = candidate
+            if not blender_key or manifest_blender_key != blender_key:
+                continue
+            if source_ok and mtime > best["blender_manifest"]:
+                best["blender_manifest"] = mtime
+                result["blender_manifest"] = candidate
+            if (
+                want_signature
+                and mtime > best["signature_manifest"]
+                and (not signature_source or manifest_source == signature_source)
+            ):
+                entry = read_manifest_cached(candidate, st)
+                if entry and _normalized_signature_matches(entry[0], wanted_signature):
+                    best["signature_manifest"] = mtime
+                    result["signature_manifest"] = candidate
+            if want_saved_sp and mtime > best["latest_saved_sp"]:
+                entry = read_manifest_cached(candidate, st)
+                saved_file = get_manifest_sp_project_file(entry[0] if entry else None)
+                if not saved_file or is_temp_sp_project_file(saved_file):
+                    continue
+                if not os.path.isfile(saved_file):
+                    continue
+                best["latest_saved_sp"] = mtime
+                result["latest_saved_sp"] = saved_file
+    for key in ("blender_manifest", "sp_manifest", "signature_manifest"):
+        if result[key]:
+            result[key] = Path(result[key])
+    return result
 
 
 def find_manifest_for_blender_file(bridge_roots, blender_file, source=None):
     if not blender_file:
         return None
-    best_path = None
-    best_time = -1.0
-    for root in bridge_roots:
-        if not root or not root.exists():
-            continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
-                continue
-            manifest = read_manifest(candidate)
-            if not manifest:
-                continue
-            if source and manifest.get("source") != source:
-                continue
-            manifest_blender = manifest.get("blender_file")
-            if not manifest_blender or not paths_match(manifest_blender, blender_file):
-                continue
-            if mtime > best_time:
-                best_time = mtime
-                best_path = candidate
-    return best_path
+    return scan_bridge_roots(bridge_roots, blender_file=blender_file, source=source)[
+        "blender_manifest"
+    ]
 
 
 def find_manifest_for_sp_project_file(bridge_roots, sp_project_file, source=None):
     if not sp_project_file:
         return None
-    best_path = None
-    best_time = -1.0
-    for root in bridge_roots:
-        if not root or not root.exists():
-            continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
-                continue
-            manifest = read_manifest(candidate)
-            if not manifest:
-                continue
-            if source and manifest.get("source") != source:
-                continue
-            manifest_sp = manifest.get("sp_project_file") or manifest.get("sp_project_path")
-            if not manifest_sp or not paths_match(manifest_sp, sp_project_file):
-                continue
-            if mtime > best_time:
-                best_time = mtime
-                best_path = candidate
-    return best_path
+    return scan_bridge_roots(bridge_roots, sp_project_file=sp_project_file, source=source)[
+        "sp_manifest"
+    ]
 
 
 def project_dir_from_linked_sp(blender_file, prefs):
@@ -1008,74 +1592,37 @@ def normalize_mesh_signature(value):
 
 
 def mesh_signature_matches(manifest, signature):
-    if not signature or not isinstance(manifest, dict):
+    if not signature:
+        return False
+    return _normalized_signature_matches(manifest, normalize_mesh_signature(signature))
+
+
+def _normalized_signature_matches(manifest, wanted):
+    if not isinstance(manifest, dict):
         return False
     manifest_sig = normalize_mesh_signature(manifest.get("mesh_signature"))
     if not manifest_sig["low"] and not manifest_sig["high"]:
         return False
-    return manifest_sig == normalize_mesh_signature(signature)
+    return manifest_sig == wanted
 
 
 def find_latest_saved_sp_project_for_blender(bridge_roots, blender_file):
     if not blender_file:
         return ""
-    best_file = ""
-    best_time = -1.0
-    for root in bridge_roots:
-        if not root or not root.exists():
-            continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
-                continue
-            manifest = read_manifest(candidate)
-            if not manifest:
-                continue
-            manifest_blender = get_manifest_blender_file(manifest)
-            if not manifest_blender or not paths_match(manifest_blender, blender_file):
-                continue
-            sp_project_file = get_manifest_sp_project_file(manifest)
-            if not sp_project_file or is_temp_sp_project_file(sp_project_file):
-                continue
-            try:
-                if not Path(sp_project_file).is_file():
-                    continue
-            except OSError:
-                continue
-            if mtime > best_time:
-                best_time = mtime
-                best_file = sp_project_file
-    return best_file
+    return scan_bridge_roots(bridge_roots, blender_file=blender_file, saved_sp=True)[
+        "latest_saved_sp"
+    ]
 
 
 def find_manifest_for_mesh_signature(bridge_roots, blender_file, signature, source="blender"):
     if not blender_file or not signature:
         return None
-    best_path = None
-    best_time = -1.0
-    for root in bridge_roots:
-        if not root or not root.exists():
-            continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
-                continue
-            manifest = read_manifest(candidate)
-            if not manifest:
-                continue
-            if source and manifest.get("source") != source:
-                continue
-            manifest_blender = get_manifest_blender_file(manifest)
-            if not manifest_blender or not paths_match(manifest_blender, blender_file):
-                continue
-            if not mesh_signature_matches(manifest, signature):
-                continue
-            if mtime > best_time:
-                best_time = mtime
-                best_path = candidate
-    return best_path
+    return scan_bridge_roots(
+        bridge_roots,
+        blender_file=blender_file,
+        signature=signature,
+        signature_source=source,
+    )["signature_manifest"]
 
 
 def project_dir_signature_matches(project_dir, signature):
@@ -1092,25 +1639,23 @@ def project_dir_signature_matches(project_dir, signature):
     return mesh_signature_matches(manifest, signature)
 
 
-def resolve_sp_project_candidate(sp_project_file, blender_file, prefs=None):
+def resolve_sp_project_candidate(sp_project_file, blender_file, prefs=None, scan=None):
     if not sp_project_file:
         return ""
-    if is_temp_sp_project_file(sp_project_file, prefs):
-        fallback = find_latest_saved_sp_project_for_blender(
-            get_candidate_bridge_roots(prefs),
-            blender_file,
-        )
-        return fallback or sp_project_file
     try:
-        if Path(sp_project_file).is_file():
-            return sp_project_file
+        is_temp, is_file = _classify_sp_project(sp_project_file, prefs)
     except OSError:
         return ""
-    fallback = find_latest_saved_sp_project_for_blender(
-        get_candidate_bridge_roots(prefs),
-        blender_file,
-    )
-    return fallback or ""
+    if is_file:
+        return sp_project_file
+    fallback = sp_project_file if is_temp else ""
+    if scan is None:
+        scan = scan_bridge_roots(
+            get_candidate_bridge_roots(prefs),
+            blender_file=blender_file,
+            saved_sp=True,
+        )
+    return scan["latest_saved_sp"] or fallback
 
 
 def get_manifest_sp_project_file(manifest):
@@ -1134,8 +1679,11 @@ def get_manifest_blender_file(manifest):
     return str(value) if value else ""
 
 
-def resolve_active_sp_project_info(context, prefs):
-    project_dir = get_project_dir(context, prefs)
+def resolve_active_sp_project_info(context, prefs, blender_file=None, project_dir=None):
+    if blender_file is None:
+        blender_file = get_blender_file_path_or_temp(prefs)
+    if project_dir is None:
+        project_dir = get_project_dir(context, prefs, blender_file)
     if project_dir:
         info = read_active_sp_info(project_meta_dir(project_dir) / ACTIVE_SP_INFO_FILENAME)
         if info:
@@ -1143,9 +1691,23 @@ def resolve_active_sp_project_info(context, prefs):
     active_info = find_active_sp_project_info(prefs)
     if not active_info:
         return None
-    blender_file = get_blender_file_path_or_temp(prefs)
     blender_file_is_temp = is_temp_blender_file(blender_file, prefs)
     sp_project_file = str(active_info.get("sp_project_file") or "")
+    blender_key = normalize_path_key(blender_file) if blender_file else ""
+    sp_key = normalize_path_key(sp_project_file) if sp_project_file else ""
+    scan = {}
+
+    def bridge_scan():
+        if not scan:
+            scan.update(
+                scan_bridge_roots(
+                    get_candidate_bridge_roots(prefs),
+                    blender_file=blender_file,
+                    sp_project_file=sp_project_file,
+                )
+            )
+        return scan
+
     linked_sp_project = ""
     if blender_file:
         linked_sp_project = get_linked_sp_project_path(
@@ -1153,32 +1715,30 @@ def resolve_active_sp_project_info(context, prefs):
             active_info=None,
             blender_file=blender_file,
             prefs=prefs,
+            bridge_scan=bridge_scan,
         )
     if linked_sp_project and sp_project_file:
-        if not paths_match(sp_project_file, linked_sp_project):
+        if normalize_path_key(linked_sp_project) != sp_key:
             return None
     if blender_file:
-        if paths_match(active_info.get("blender_file"), blender_file):
+        active_blender = active_info.get("blender_file")
+        if active_blender and normalize_path_key(active_blender) == blender_key:
             return active_info
         if sp_project_file:
             registry = load_link_registry(prefs)
-            linked_blender = registry.get("sp_to_blender", {}).get(
-                normalize_path_key(sp_project_file)
-            )
-            if linked_blender and paths_match(linked_blender, blender_file):
+            linked_blender = registry.get("sp_to_blender", {}).get(sp_key)
+            if linked_blender and normalize_path_key(linked_blender) == blender_key:
                 return active_info
-            manifest_path = find_manifest_for_sp_project_file(
-                get_candidate_bridge_roots(prefs),
-                sp_project_file,
-            )
+            manifest_path = bridge_scan()["sp_manifest"]
             if manifest_path:
                 manifest = read_manifest(manifest_path)
                 manifest_blender = get_manifest_blender_file(manifest)
-                if manifest_blender and paths_match(manifest_blender, blender_file):
+                if manifest_blender and normalize_path_key(manifest_blender) == blender_key:
                     return active_info
         if project_dir and sp_project_file:
             manifest = read_manifest(find_project_manifest_path(project_dir))
-            if manifest and paths_match(get_manifest_sp_project_file(manifest), sp_project_file):
+            manifest_sp = get_manifest_sp_project_file(manifest)
+            if manifest_sp and normalize_path_key(manifest_sp) == sp_key:
                 return active_info
         if not blender_file_is_temp:
             return None
@@ -1191,7 +1751,8 @@ def resolve_active_sp_project_info(context, prefs):
             return active_info
     if project_dir and sp_project_file:
         manifest = read_manifest(find_project_manifest_path(project_dir))
-        if manifest and paths_match(get_manifest_sp_project_file(manifest), sp_project_file):
+        manifest_sp = get_manifest_sp_project_file(manifest)
+        if manifest_sp and normalize_path_key(manifest_sp) == sp_key:
             return active_info
     return None
 
@@ -1201,6 +1762,7 @@ def get_linked_sp_project_path(
     active_info=None,
     blender_file=None,
     prefs=None,
+    bridge_scan=None,
 ):
     if active_info:
         sp_project_file = str(active_info.get("sp_project_file") or "")
@@ -1215,10 +1777,13 @@ def get_linked_sp_project_path(
             return str(sp_project_file)
     sp_project_file = ""
     if blender_file:
-        manifest_path = find_manifest_for_blender_file(
-            get_candidate_bridge_roots(prefs),
-            blender_file,
-        )
+        if bridge_scan is not None:
+            manifest_path = bridge_scan()["blender_manifest"]
+        else:
+            manifest_path = find_manifest_for_blender_file(
+                get_candidate_bridge_roots(prefs),
+                blender_file,
+            )
         if manifest_path:
             manifest = read_manifest(manifest_path)
             sp_project_file = get_manifest_sp_project_file(manifest)
@@ -1270,12 +1835,7 @@ def get_linked_sp_project_path_fast(
     return ""
 
 
-def resolve_linked_sp_project_file_fast(
-    project_dir,
-    active_info=None,
-    blender_file=None,
-    prefs=None,
-):
+def _resolve_link_state(project_dir, active_info, blender_file, prefs):
     sp_project_file = get_linked_sp_project_path_fast(
         project_dir,
         active_info=active_info,
@@ -1283,30 +1843,86 @@ def resolve_linked_sp_project_file_fast(
         prefs=prefs,
     )
     if not sp_project_file:
-        return ""
-    if is_temp_sp_project_file(sp_project_file, prefs):
-        return sp_project_file
-    try:
-        if Path(sp_project_file).is_file():
-            return sp_project_file
-    except OSError:
-        return ""
-    return ""
+        return "", "", False, False
+    is_temp = is_temp_sp_project_file(sp_project_file, prefs)
+    exists = False if is_temp else _cached_is_file(sp_project_file)
+    linked = sp_project_file if is_temp or exists else ""
+    return sp_project_file, linked, is_temp, exists
 
 
-def folder_size_bytes(path):
-    if not path or not path.exists():
-        return 0
+def _dir_entries_size(path):
     total = 0
-    for dirpath, _, filenames in os.walk(path):
-        for filename in filenames:
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
             try:
-                total += (Path(dirpath) / filename).stat().st_size
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
             except OSError:
                 continue
+    return total, subdirs
+
+
+def _dir_entries_size_cached(path):
+    st = os.stat(path)
+    key = normalize_path_key(path)
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _dir_size_memo.get(key)
+    if (
+        cached
+        and cached[0] == st.st_mtime_ns
+        and now - cached[1] < DIR_SIZE_MEMO_MAX_AGE
+    ):
+        return cached[2], list(cached[3])
+    total, subdirs = _dir_entries_size(path)
+    with _cache_lock:
+        _dir_size_memo[key] = (st.st_mtime_ns, now, total, tuple(subdirs))
+    return total, subdirs
+
+
+def _invalidate_dir_size(path):
+    key = normalize_path_key(path)
+    if not key:
+        return
+    prefix = key.rstrip("\\/") + os.sep
+    with _cache_lock:
+        for cached_key in [k for k in _dir_size_memo if k == key or k.startswith(prefix)]:
+            del _dir_size_memo[cached_key]
+
+
+def _tree_size_bytes(path):
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            size, subdirs = _dir_entries_size_cached(stack.pop())
+        except OSError:
+            continue
+        total += size
+        stack.extend(subdirs)
     return total
 
 
+def _folder_sizes(path):
+    try:
+        total, subdirs = _dir_entries_size_cached(path)
+    except OSError:
+        return 0, {}
+    sizes = _map_parallel(_tree_size_bytes, subdirs)
+    return total + sum(sizes), dict(zip(subdirs, sizes))
+
+
+def folder_size_bytes(path):
+    if not path:
+        return 0
+    return _folder_sizes(path)[0]
+
+
 def bridge_cache_size_bytes(prefs):
     return folder_size_bytes(get_bridge_root(prefs))
 
@@ -1315,9 +1931,30 @@ def project_cache_size_bytes(context, prefs):
     return folder_size_bytes(get_project_dir(context, prefs))
 
 
+def cache_sizes_bytes(context, prefs, project_dir=None):
+    if project_dir is None:
+        project_dir = get_project_dir(context, prefs)
+    return _cache_sizes_for_paths(get_bridge_root(prefs), project_dir)
+
+
+def _cache_sizes_for_paths(bridge_root, project_dir):
+    project_key = normalize_path_key(project_dir)
+    if project_key and os.path.dirname(project_key) != normalize_path_key(bridge_root):
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="gob_cache_size") as executor:
+            project_future = executor.submit(folder_size_bytes, project_dir)
+            total = folder_size_bytes(bridge_root)
+            return total, project_future.result()
+    total, children = _folder_sizes(bridge_root)
+    for child, size in children.items():
+        if normalize_path_key(child) == project_key:
+            return total, size
+    return total, folder_size_bytes(project_dir)
+
+
 def clear_cache_dir(path):
     if not path.exists():
         return "empty"
+    _invalidate_dir_size(path)
     try:
         shutil.rmtree(path)
     except OSError:
@@ -1326,43 +1963,58 @@ def clear_cache_dir(path):
     return "cleared"
 
 
+_CACHE_ROOT_KEEP_FILES = frozenset({BRIDGE_ROOT_HINT_FILENAME, ACTIVE_SP_INFO_FILENAME})
+
+
+def _delete_cache_child(child):
+    try:
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+    except OSError:
+        return False
+    return True
+
+
 def clear_cache_dir_except(root, keep_paths=None):
     if not root.exists():
         return "empty"
     keep = set()
     if keep_paths:
+        try:
+            root_resolved = root.resolve()
+        except OSError:
+            root_resolved = None
         for path in keep_paths:
-            if not path:
+            if not path or root_resolved is None:
                 continue
             try:
                 path_obj = Path(path).resolve()
             except OSError:
                 continue
-            try:
-                if root.resolve() not in path_obj.parents and path_obj != root.resolve():
-                    continue
-            except OSError:
+            if path_obj.parent != root_resolved and path_obj != root_resolved:
                 continue
             keep.add(str(path_obj).lower())
+    to_delete = []
     try:
-        for child in root.iterdir():
-            try:
-                child_key = str(child.resolve()).lower()
-            except OSError:
-                child_key = str(child).lower()
-            if child.is_file() and child.name in {BRIDGE_ROOT_HINT_FILENAME, ACTIVE_SP_INFO_FILENAME}:
-                continue
-            if child_key in keep:
-                continue
-            try:
-                if child.is_dir():
-                    shutil.rmtree(child)
-                else:
-                    child.unlink()
-            except OSError:
-                return "error"
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name in _CACHE_ROOT_KEEP_FILES and entry.is_file():
+                    continue
+                if keep:
+                    try:
+                        child_key = os.path.realpath(entry.path).lower()
+                    except OSError:
+                        child_key = entry.path.lower()
+                    if child_key in keep:
+                        continue
+                to_delete.append(Path(entry.path))
     except OSError:
         return "error"
+    _invalidate_dir_size(root)
+    if not all(_map_parallel(_delete_cache_child, to_delete)):
+        return "error"
     ensure_dir(root)
     return "cleared"
 
@@ -1379,15 +2031,16 @@ def cache_limit_bytes(prefs):
     return limit_gb * 1024 ** 3
 
 
+@lru_cache(maxsize=256)
 def format_bytes(value):
     size = float(value or 0)
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if size < 1024.0 or unit == "TB":
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} TB"
+    if size < 1024.0:
+        return f"{size:.1f} B"
+    index = min((int(size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size / _BYTE_UNIT_DIVISORS[index]:.1f} {_BYTE_UNITS[index]}"
 
 
+@lru_cache(maxsize=1)
 def local_version_string():
     version = bl_info.get("version")
     if isinstance(version, (tuple, list)):
@@ -1395,8 +2048,9 @@ def local_version_string():
     return str(version or "0.0.0")
 
 
+@lru_cache(maxsize=32)
 def parse_version(value):
-    parts = re.findall(r"\d+", str(value))
+    parts = _VERSION_RE.findall(str(value))
     return tuple(int(part) for part in parts) if parts else (0,)
 
 
@@ -1404,7 +2058,23 @@ def is_version_newer(remote, local):
     return parse_version(remote) > parse_version(local)
 
 
-def check_for_updates():
+def check_for_updates(force=False):
+    if not force and time.monotonic() < _update_cache["expires"]:
+        return _update_cache["value"]
+    with _update_cache_lock:
+        if not force and time.monotonic() < _update_cache["expires"]:
+            return _update_cache["value"]
+        result = _fetch_update_info()
+        ttl = UPDATE_ERROR_TTL if result.get("status") == "error" else UPDATE_CACHE_TTL
+        _update_cache["value"] = result
+        _update_cache["expires"] = time.monotonic() + ttl
+        return result
+
+
+def _fetch_update_info():
+    import urllib.error
+    import urllib.request
+
     try:
         with urllib.request.urlopen(UPDATE_URL, timeout=4) as response:
             data = json.load(response)
@@ -1434,58 +2104,39 @@ def check_for_updates():
             "local_version": local_version,
         },
     }
-
-
-def detect_map_type(stem_lower):
-    for keyword in ("opacity", "alpha", "transparency", "transparent", "cutout"):
-        if keyword in stem_lower:
-            return "opacity", keyword
-    match = re.search(r"(?:^|[._\\-])base(?:$|[._\\-])", stem_lower)
-    if match:
-        return "base_color", match.group(0)
-    if "materialparams" in stem_lower or "materialparam" in stem_lower:
-        return "orm", "materialparams"
-    if "maskmap" in stem_lower:
-        return "orm", "maskmap"
-    if "occlusionroughnessmetallic" in stem_lower:
-        return "orm", "occlusionroughnessmetallic"
-    if "occlusionroughnessmetal" in stem_lower:
-        return "orm", "occlusionroughnessmetal"
-    match = re.search(r"occlusion[._\\-]?roughness[._\\-]?metallic", stem_lower)
-    if match:
-        return "orm", match.group(0)
-    match = re.search(r"occlusion[._\\-]?roughness[._\\-]?metal", stem_lower)
-    if match:
-        return "orm", match.group(0)
-    match = re.search(r"(?:^|[._\\-])arm(?:$|[._\\-])", stem_lower)
-    if match:
-        return "orm", match.group(0)
-    match = re.search(r"(?:^|[._\\-])orm(?:$|[._\\-])", stem_lower)
-    if match:
-        return "orm", match.group(0)
-    match = re.search(r"metallic[._\\-]?roughness", stem_lower)
-    if match:
-        return "metallic_roughness", match.group(0)
-    match = re.search(r"roughness[._\\-]?metallic", stem_lower)
-    if match:
-        return "metallic_roughness", match.group(0)
-    match = re.search(r"metallic[._\\-]?smoothness", stem_lower)
-    if match:
-        return "metallic_smoothness", match.group(0)
-    match = re.search(r"specular[._\\-]?smoothness", stem_lower)
-    if match:
-        return "specular_smoothness", match.group(0)
-    match = re.search(r"specular[._\\-]?gloss", stem_lower)
-    if match:
-        return "specular_smoothness", match.group(0)
-    if re.search(r"specgloss", stem_lower):
-        return "specular_smoothness", "specgloss"
-    match = re.search(r"mask[._\\-]?map", stem_lower)
-    if match:
-        return "mask", match.group(0)
-    for keyword, map_type in MAP_KEYWORDS:
-        if keyword in stem_lower:
-            return map_type, keyword
+
+
+def map_keyword_for(stem_lower):
+    best_index = len(MAP_KEYWORDS)
+    best = (None, None)
+    for match in _MAP_KEYWORD_RE.finditer(stem_lower):
+        keyword = match.group(1)
+        index, map_type = _MAP_KEYWORD_LOOKUP[keyword]
+        if index < best_index:
+            best_index = index
+            best = (map_type, keyword)
+            if index == 0:
+                break
+    return best
+
+
+@lru_cache(maxsize=2048)
+def detect_map_type(stem_lower):
+    best_index = len(_MAP_TYPE_RULES)
+    best_text = None
+    for match in _MAP_TYPE_RE.finditer(stem_lower):
+        index = match.lastindex - 1
+        if index < best_index:
+            best_index = index
+            best_text = match.group(match.lastindex)
+            if index == 0:
+                break
+    if best_text is not None:
+        _, map_type, keyword = _MAP_TYPE_RULES[best_index]
+        return map_type, keyword or best_text
+    map_type, keyword = map_keyword_for(stem_lower)
+    if map_type:
+        return map_type, keyword
     if "rgb" in stem_lower:
         return "base_color", "rgb"
     return None, None
@@ -1496,17 +2147,15 @@ def should_invert_normal_y(path, manifest=None):
         fmt = manifest.get("normal_map_format") or manifest.get("normal_format")
         if fmt:
             fmt_lower = str(fmt).lower()
-            if "directx" in fmt_lower or "d3d" in fmt_lower or fmt_lower == "dx":
+            if fmt_lower == "dx" or any(token in fmt_lower for token in _DX_FORMAT_TOKENS):
                 return True
-            if "opengl" in fmt_lower or "ogl" in fmt_lower or fmt_lower == "gl":
+            if fmt_lower == "gl" or any(token in fmt_lower for token in _GL_FORMAT_TOKENS):
                 return False
         if "normal_map_y_invert" in manifest:
             return bool(manifest.get("normal_map_y_invert"))
     name = Path(path).stem.lower()
-    if "directx" in name or "d3d" in name or "_dx" in name or name.endswith("dx"):
+    if name.endswith("dx") or any(token in name for token in _DX_NAME_TOKENS):
         return True
-    if "opengl" in name or "ogl" in name or "_gl" in name or name.endswith("gl"):
-        return False
     return False
 
 
@@ -1525,17 +2174,18 @@ def guess_texture_set_name(stem, keyword, fallback=None):
 def normalize_texset_name(name):
     if not name:
         return name
-    match = re.match(r"(?i)^(b2sp|sp2b)[._-]+(.+)$", name)
+    match = _TEXSET_PREFIX_RE.match(name)
     if match:
-        return match.group(2)
+        return match.group(1)
     return name
 
 
+@lru_cache(maxsize=4096)
 def normalize_match_name(name):
     if not name:
         return ""
     name = normalize_texset_name(str(name))
-    return re.sub(r"[^a-z0-9]+", "", name.lower())
+    return _MATCH_NAME_RE.sub("", name.lower())
 
 
 def map_keyword_in_name(name):
@@ -1572,18 +2222,22 @@ def gather_texture_paths(manifest):
                 path = base_dir / path
             paths.append(str(path))
     if base_dir:
-        for ext in IMAGE_EXTS:
-            for path in base_dir.rglob(f"*{ext}"):
-                if path.is_file():
-                    paths.append(str(path))
-    seen = set()
-    unique = []
-    for path in paths:
-        if path in seen:
-            continue
-        seen.add(path)
-        unique.append(path)
-    return unique
+        stack = [str(base_dir)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.name.lower().endswith(_IMAGE_EXTS_TUPLE) and entry.is_file():
+                                paths.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+    return list(dict.fromkeys(paths))
 
 
 def group_textures(texture_paths):
@@ -1594,7 +2248,7 @@ def group_textures(texture_paths):
         stem_lower = stem.lower()
         map_type, keyword = detect_map_type(stem_lower)
         if not map_type:
-            path_key = re.sub(r"[\\\\/]+", "_", str(path_obj).lower())
+            path_key = str(path_obj).lower().translate(_SLASH_TRANSLATE)
             map_type, keyword = detect_map_type(path_key)
         if not map_type:
             continue
@@ -1605,11 +2259,14 @@ def group_textures(texture_paths):
                     keyword = base_hint
                     break
         fallback = None
-        lower_parts = [part.lower() for part in path_obj.parts]
-        if "textures" in lower_parts:
+        parts = path_obj.parts
+        lower_parts = tuple(part.lower() for part in parts)
+        try:
             idx = len(lower_parts) - 1 - lower_parts[::-1].index("textures")
-            if idx + 1 < len(path_obj.parts):
-                fallback = path_obj.parts[idx + 1]
+        except ValueError:
+            idx = -1
+        if 0 <= idx < len(parts) - 1:
+            fallback = parts[idx + 1]
         texset = guess_texture_set_name(stem, keyword, fallback=fallback)
         if texset == stem and map_keyword_in_name(stem_lower):
             guessed = fallback or guess_texset_from_path(path_obj)
@@ -1622,7 +2279,19 @@ def group_textures(texture_paths):
     return grouped
 
 
+def clear_image_memo():
+    _image_memo.clear()
+
+
 def load_image(path):
+    key = os.path.normcase(os.path.abspath(path))
+    image = _image_memo.get(key)
+    if image is not None:
+        try:
+            image.name
+            return image
+        except ReferenceError:
+            _image_memo.pop(key, None)
     try:
         image = bpy.data.images.load(path, check_existing=True)
     except RuntimeError:
@@ -1631,6 +2300,7 @@ def load_image(path):
         image.reload()
     except RuntimeError:
         pass
+    _image_memo[key] = image
     return image
 
 
@@ -1663,28 +2333,10 @@ def build_material(mat, maps, normal_y_invert=False, manifest=None):
     principled.location = (200, 0)
     links.new(principled.outputs["BSDF"], output.inputs["Surface"])
 
-    base_node = None
-    ao_node = None
-    height_node = None
-    gloss_node = None
-    normal_node = None
-    emission_node = None
-    opacity_node = None
-    metallic_node = None
-    roughness_node = None
-    orm_node = None
-    mask_node = None
-    metallic_roughness_node = None
-    metallic_smoothness_node = None
-    specular_node = None
-    specular_smoothness_node = None
-
+    texture_nodes = {}
     y = 300
     step = -220
-    for map_type in ("base_color", "orm", "metallic_roughness", "metallic_smoothness",
-                     "mask", "ao", "metallic", "roughness", "glossiness",
-                     "specular_smoothness", "specular", "normal", "height",
-                     "opacity", "emission"):
+    for map_type in MATERIAL_MAP_ORDER:
         if map_type not in maps:
             continue
         tex = nodes.new("ShaderNodeTexImage")
@@ -1694,44 +2346,28 @@ def build_material(mat, maps, normal_y_invert=False, manifest=None):
         if not image:
             continue
         tex.image = image
-        if map_type in {"normal", "roughness", "metallic", "ao", "height",
-                        "opacity", "glossiness", "orm", "metallic_roughness",
-                        "metallic_smoothness", "mask", "specular_smoothness",
-                        "specular"}:
+        if map_type in NON_COLOR_MAP_TYPES:
             try:
                 image.colorspace_settings.name = "Non-Color"
             except TypeError:
                 pass
-        if map_type == "base_color":
-            base_node = tex
-        elif map_type == "orm":
-            orm_node = tex
-        elif map_type == "metallic_roughness":
-            metallic_roughness_node = tex
-        elif map_type == "metallic_smoothness":
-            metallic_smoothness_node = tex
-        elif map_type == "mask":
-            mask_node = tex
-        elif map_type == "ao":
-            ao_node = tex
-        elif map_type == "metallic":
-            metallic_node = tex
-        elif map_type == "roughness":
-            roughness_node = tex
-        elif map_type == "glossiness":
-            gloss_node = tex
-        elif map_type == "specular_smoothness":
-            specular_smoothness_node = tex
-        elif map_type == "specular":
-            specular_node = tex
-        elif map_type == "normal":
-            normal_node = tex
-        elif map_type == "height":
-            height_node = tex
-        elif map_type == "opacity":
-            opacity_node = tex
-        elif map_type == "emission":
-            emission_node = tex
+        texture_nodes[map_type] = tex
+
+    base_node = texture_nodes.get("base_color")
+    orm_node = texture_nodes.get("orm")
+    metallic_roughness_node = texture_nodes.get("metallic_roughness")
+    metallic_smoothness_node = texture_nodes.get("metallic_smoothness")
+    mask_node = texture_nodes.get("mask")
+    ao_node = texture_nodes.get("ao")
+    metallic_node = texture_nodes.get("metallic")
+    roughness_node = texture_nodes.get("roughness")
+    gloss_node = texture_nodes.get("glossiness")
+    specular_smoothness_node = texture_nodes.get("specular_smoothness")
+    specular_node = texture_nodes.get("specular")
+    normal_node = texture_nodes.get("normal")
+    height_node = texture_nodes.get("height")
+    opacity_node = texture_nodes.get("opacity")
+    emission_node = texture_nodes.get("emission")
 
     ao_output = ao_node.outputs["Color"] if ao_node else None
     metallic_output = metallic_node.outputs["Color"] if metallic_node else None
@@ -1869,17 +2505,21 @@ def build_material(mat, maps, normal_y_invert=False, manifest=None):
 
     if emission_node:
         emission_input = None
+        emission_strength = None
         for socket in principled.inputs:
-            if socket.name in {"Emission", "Emission Color"}:
-                emission_input = socket
+            socket_name = socket.name
+            if socket_name == "Emission Strength":
+                if emission_strength is None:
+                    emission_strength = socket
+            elif socket_name in _EMISSION_SOCKET_NAMES:
+                if emission_input is None:
+                    emission_input = socket
+            else:
+                continue
+            if emission_input is not None and emission_strength is not None:
                 break
         if emission_input:
             links.new(emission_node.outputs["Color"], emission_input)
-        emission_strength = None
-        for socket in principled.inputs:
-            if socket.name == "Emission Strength":
-                emission_strength = socket
-                break
         if emission_strength:
             emission_strength.default_value = 1.0
 
@@ -1899,23 +2539,62 @@ def build_material(mat, maps, normal_y_invert=False, manifest=None):
     return mat
 
 
+def _material_build_key(maps, normal_y_invert, manifest):
+    return (
+        tuple(sorted((str(k), str(v)) for k, v in maps.items())),
+        bool(normal_y_invert),
+        bool(manifest and manifest.get("basecolor_has_opacity")),
+    )
+
+
 def get_or_build_material(name, maps, normal_y_invert=False, manifest=None):
-    mat = bpy.data.materials.get(name)
+    data_materials = bpy.data.materials
+    mat = data_materials.get(name)
     if not mat:
-        mat = bpy.data.materials.new(name=name)
-    return build_material(mat, maps, normal_y_invert=normal_y_invert, manifest=manifest)
+        mat = data_materials.new(name=name)
+    build_key = _material_build_key(maps, normal_y_invert, manifest)
+    cached = _material_build_cache.get(name)
+    if (
+        cached
+        and cached == (mat.as_pointer(), build_key)
+        and mat.get("gob_bridge_material")
+        and mat.node_tree
+        and len(mat.node_tree.nodes)
+    ):
+        for path in maps.values():
+            load_image(path)
+        return mat
+    mat = build_material(mat, maps, normal_y_invert=normal_y_invert, manifest=manifest)
+    if all(node.image for node in mat.node_tree.nodes if node.type == "TEX_IMAGE"):
+        _material_build_cache[name] = (mat.as_pointer(), build_key)
+    else:
+        _material_build_cache.pop(name, None)
+    return mat
+
+
+@persistent
+def _clear_material_build_cache(_context=None):
+    _material_build_cache.clear()
 
 
-def assign_material_to_object(obj, material, texset_name, all_groups):
+def material_slot_keys(obj):
+    return [
+        normalize_match_name(slot.material.name) if slot.material else None
+        for slot in obj.material_slots
+    ]
+
+
+def assign_material_to_object(obj, material, texset_name, all_groups, slot_keys=None):
     if obj.type != "MESH":
         return
     target_slot = None
     texset_key = normalize_match_name(texset_name)
-    if obj.material_slots:
-        for idx, slot in enumerate(obj.material_slots):
-            if slot.material and normalize_match_name(slot.material.name) == texset_key:
-                target_slot = idx
-                break
+    if slot_keys is None:
+        slot_keys = material_slot_keys(obj)
+    for idx, slot_key in enumerate(slot_keys):
+        if slot_key is not None and slot_key == texset_key:
+            target_slot = idx
+            break
     if target_slot is None:
         if len(all_groups) == 1 and obj.material_slots:
             target_slot = 0
@@ -1928,48 +2607,48 @@ def assign_material_to_object(obj, material, texset_name, all_groups):
     obj.data.materials[target_slot] = material
 
 
-def find_signature_targets(context, manifest):
+def find_signature_targets(context, manifest, mesh_index=None):
     if not manifest:
         return []
     signature = normalize_mesh_signature(manifest.get("mesh_signature"))
     low_names = {name for name in (signature.get("low") or []) if name}
     if not low_names:
         return []
-    return [
-        obj for obj in context.scene.objects
-        if obj.type == "MESH" and obj.name in low_names
-    ]
+    if mesh_index is None:
+        return [obj for obj in scene_meshes(context) if obj.name in low_names]
+    positions = mesh_index["positions"]
+    meshes = mesh_index["meshes"]
+    hits = sorted(positions[name] for name in low_names if name in positions)
+    return [meshes[idx] for idx in hits]
 
 
-def find_texture_targets(context, grouped):
+def find_texture_targets(context, grouped, mesh_index=None):
     if not grouped:
         return []
     keys = {normalize_match_name(key) for key in grouped if key}
+    name_keys = [key for key in keys if key]
+    name_re = re.compile("|".join(map(re.escape, name_keys))) if name_keys else None
     matches = []
-    for obj in context.scene.objects:
-        if obj.type != "MESH":
-            continue
-        matched = False
-        for slot in obj.material_slots:
-            if slot.material and normalize_match_name(slot.material.name) in keys:
-                matched = True
-                break
-        if not matched:
-            lname = normalize_match_name(obj.name)
-            if any(key and key in lname for key in keys):
-                matched = True
-        if matched:
+    meshes = scene_meshes(context, mesh_index)
+    for obj in meshes:
+        if any(
+            slot.material and normalize_match_name(slot.material.name) in keys
+            for slot in obj.material_slots
+        ):
+            matches.append(obj)
+        elif name_re is not None and name_re.search(normalize_match_name(obj.name)):
             matches.append(obj)
     if matches:
         return matches
     if len(keys) == 1:
         if context.active_object and context.active_object.type == "MESH":
             return [context.active_object]
-        return [obj for obj in context.scene.objects if obj.type == "MESH"]
+        return list(meshes)
     return []
 
 
 def apply_textures_to_objects(objects, grouped, manifest=None, strict=False):
+    clear_image_memo()
     if not grouped:
         return
     materials = {}
@@ -1994,21 +2673,24 @@ def apply_textures_to_objects(objects, grouped, manifest=None, strict=False):
     single_target = len(mesh_targets) == 1
     for obj in mesh_targets:
         assigned = False
-        for idx, slot in enumerate(obj.material_slots):
-            if not slot.material:
-                continue
-            key = normalize_match_name(slot.material.name)
+        material_slots = obj.material_slots
+        slot_keys = material_slot_keys(obj)
+        for idx, key in enumerate(slot_keys):
             if key and key in materials:
-                obj.material_slots[idx].material = materials[key]
+                mat = materials[key]
+                slot = material_slots[idx]
+                if slot.material != mat:
+                    slot.material = mat
                 assigned = True
         if assigned:
             continue
         obj_key = normalize_match_name(obj.name)
-        for key, mat, texset in groups:
-            if key and obj_key and key in obj_key:
-                assign_material_to_object(obj, mat, texset, materials)
-                assigned = True
-                break
+        if obj_key:
+            for key, mat, texset in groups:
+                if key and key in obj_key:
+                    assign_material_to_object(obj, mat, texset, materials, slot_keys=slot_keys)
+                    assigned = True
+                    break
         if not assigned and not strict:
             if single_target and obj.material_slots and groups:
                 for idx, entry in enumerate(groups):
@@ -2019,13 +2701,20 @@ def apply_textures_to_objects(objects, grouped, manifest=None, strict=False):
                         obj.data.materials.append(mat)
                 assigned = True
             elif groups:
-                assign_material_to_object(obj, groups[0][1], groups[0][2], materials)
+                assign_material_to_object(
+                    obj, groups[0][1], groups[0][2], materials, slot_keys=slot_keys
+                )
+
+
+@lru_cache(maxsize=1)
+def _fbx_export_props():
+    return frozenset(bpy.ops.export_scene.fbx.get_rna_type().properties.keys())
 
 
 def build_fbx_export_kwargs(prefs):
     if not prefs:
         return {}
-    props = bpy.ops.export_scene.fbx.get_rna_type().properties
+    props = _fbx_export_props()
     kwargs = {}
 
     def set_if(prop_name, value):
@@ -2052,31 +2741,50 @@ def remove_uv_layers(mesh):
             continue
 
 
-def object_is_valid(obj):
+def object_is_valid(obj, data_objects=None):
     try:
         name = obj.name
     except ReferenceError:
         return False
-    return name in bpy.data.objects
+    if data_objects is None:
+        data_objects = bpy.data.objects
+    return name in data_objects
 
 
 def unique_object_name(base):
-    name = base
+    existing = bpy.data.objects
+    if base not in existing:
+        return base
+    prefix = f"{base}_"
+    offset = len(prefix)
+    used = set()
+    for name in existing.keys():
+        if name.startswith(prefix):
+            suffix = name[offset:]
+            if suffix.isdecimal():
+                used.add(int(suffix))
     idx = 1
-    while name in bpy.data.objects:
-        name = f"{base}_{idx}"
+    while idx in used:
         idx += 1
-    return name
+    return f"{prefix}{idx}"
 
 
 def export_fbx_objects(filepath, objects, prefs=None, strip_uvs=False):
-    export_objs = [obj for obj in objects if object_is_valid(obj) and obj.type == "MESH"]
+    data_objects = bpy.data.objects
+    export_objs = [
+        obj for obj in objects
+        if object_is_valid(obj, data_objects) and obj.type == "MESH"
+    ]
     if not export_objs:
         return False
     temp_objects = []
     renamed_objects = []
     if strip_uvs:
+        stripped_objs = []
         for obj in export_objs:
+            if not obj.data.uv_layers:
+                stripped_objs.append(obj)
+                continue
             orig_name = obj.name
             temp_name = unique_object_name(f"{orig_name}__gob_src")
             try:
@@ -2089,9 +2797,9 @@ def export_fbx_objects(filepath, objects, prefs=None, strip_uvs=False):
             dup.name = orig_name
             bpy.context.scene.collection.objects.link(dup)
             temp_objects.append(dup)
-        export_objs = temp_objects
-    if strip_uvs:
-        for obj in export_objs:
+            stripped_objs.append(dup)
+        export_objs = stripped_objs
+        for obj in temp_objects:
             remove_uv_layers(obj.data)
     obj_states = []
     layer_states = []
@@ -2100,6 +2808,9 @@ def export_fbx_objects(filepath, objects, prefs=None, strip_uvs=False):
     seen_layers = set()
     seen_collections = set()
     view_layer = bpy.context.view_layer
+    layer_index = None
+    if view_layer and view_layer.layer_collection:
+        layer_index = _layer_collection_index(view_layer.layer_collection)
     for obj in export_objs:
         try:
             obj_key = obj.as_pointer()
@@ -2107,28 +2818,12 @@ def export_fbx_objects(filepath, objects, prefs=None, strip_uvs=False):
             obj_key = id(obj)
         if obj_key not in seen_objs:
             seen_objs.add(obj_key)
-            obj_states.append((
-                obj,
-                getattr(obj, "hide_viewport", False),
-                getattr(obj, "hide_render", False),
-                getattr(obj, "hide_select", False),
-            ))
+            obj_states.append((obj, tuple(getattr(obj, attr, False) for attr in _HIDE_ATTRS)))
             try:
                 obj.hide_set(False)
             except Exception:
                 pass
-            try:
-                obj.hide_viewport = False
-            except Exception:
-                pass
-            try:
-                obj.hide_render = False
-            except Exception:
-                pass
-            try:
-                obj.hide_select = False
-            except Exception:
-                pass
+            _force_attrs(obj, _HIDE_ATTRS, False)
         for collection in obj.users_collection:
             try:
                 col_key = collection.as_pointer()
@@ -2138,26 +2833,12 @@ def export_fbx_objects(filepath, objects, prefs=None, strip_uvs=False):
                 seen_collections.add(col_key)
                 collection_states.append((
                     collection,
-                    getattr(collection, "hide_viewport", False),
-                    getattr(collection, "hide_render", False),
-                    getattr(collection, "hide_select", False),
+                    tuple(getattr(collection, attr, False) for attr in _HIDE_ATTRS),
                 ))
-                try:
-                    collection.hide_viewport = False
-                except Exception:
-                    pass
-                try:
-                    collection.hide_render = False
-                except Exception:
-                    pass
-                try:
-                    collection.hide_select = False
-                except Exception:
-                    pass
-            if view_layer and view_layer.layer_collection:
-                matches = []
-                _find_layer_collections(view_layer.layer_collection, collection, matches)
-                for layer in matches:
+                _force_attrs(collection, _HIDE_ATTRS, False)
+                if layer_index is None:
+                    continue
+                for layer in layer_index.get(col_key, ()):
                     try:
                         layer_key = layer.as_pointer()
                     except Exception:
@@ -2167,109 +2848,54 @@ def export_fbx_objects(filepath, objects, prefs=None, strip_uvs=False):
                     seen_layers.add(layer_key)
                     layer_states.append((
                         layer,
-                        getattr(layer, "exclude", False),
-                        getattr(layer, "hide_viewport", False),
+                        tuple(getattr(layer, attr, False) for attr in _LAYER_HIDE_ATTRS),
                     ))
-                    try:
-                        layer.exclude = False
-                    except Exception:
-                        pass
-                    try:
-                        layer.hide_viewport = False
-                    except Exception:
-                        pass
-    prev_selected = [obj for obj in bpy.context.selected_objects if object_is_valid(obj)]
-    prev_active = bpy.context.view_layer.objects.active
-    for obj in prev_selected:
-        try:
-            obj.select_set(False)
-        except ReferenceError:
-            continue
-    for obj in export_objs:
-        try:
-            obj.select_set(True)
-        except ReferenceError:
-            continue
-    if export_objs:
-        bpy.context.view_layer.objects.active = export_objs[0]
+                    _force_attrs(layer, _LAYER_HIDE_ATTRS, False)
     export_kwargs = build_fbx_export_kwargs(prefs)
     try:
-        bpy.ops.export_scene.fbx(
-            filepath=str(filepath),
-            use_selection=True,
-            use_mesh_modifiers=True,
-            mesh_smooth_type="FACE",
-            add_leaf_bones=False,
-            bake_space_transform=False,
-            **export_kwargs,
-        )
+        with bpy.context.temp_override(
+            selected_objects=export_objs,
+            selected_editable_objects=export_objs,
+            active_object=export_objs[0],
+            object=export_objs[0],
+        ):
+            bpy.ops.export_scene.fbx(
+                filepath=str(filepath),
+                use_selection=True,
+                use_mesh_modifiers=True,
+                mesh_smooth_type="FACE",
+                add_leaf_bones=False,
+                bake_space_transform=False,
+                **export_kwargs,
+            )
     finally:
-        for layer, was_excluded, was_hidden in layer_states:
-            try:
-                layer.exclude = was_excluded
-            except Exception:
-                pass
-            try:
-                layer.hide_viewport = was_hidden
-            except Exception:
-                pass
-        for collection, was_hidden, was_render, was_select in collection_states:
-            try:
-                collection.hide_viewport = was_hidden
-            except Exception:
-                pass
-            try:
-                collection.hide_render = was_render
-            except Exception:
-                pass
-            try:
-                collection.hide_select = was_select
-            except Exception:
-                pass
-        for obj, was_hidden, was_render, was_select in obj_states:
-            if not object_is_valid(obj):
-                continue
-            try:
-                obj.hide_viewport = was_hidden
-            except Exception:
-                pass
-            try:
-                obj.hide_render = was_render
-            except Exception:
-                pass
-            try:
-                obj.hide_select = was_select
-            except Exception:
-                pass
-        for obj in export_objs:
-            try:
-                obj.select_set(False)
-            except ReferenceError:
+        for layer, values in layer_states:
+            _restore_attrs(layer, _LAYER_HIDE_ATTRS, values)
+        for collection, values in collection_states:
+            _restore_attrs(collection, _HIDE_ATTRS, values)
+        for obj, values in obj_states:
+            if not object_is_valid(obj, data_objects):
                 continue
+            _restore_attrs(obj, _HIDE_ATTRS, values)
         if temp_objects:
+            data_meshes = bpy.data.meshes
             for obj in temp_objects:
                 mesh_data = obj.data
                 try:
-                    bpy.data.objects.remove(obj, do_unlink=True)
+                    data_objects.remove(obj, do_unlink=True)
                 except RuntimeError:
                     pass
                 try:
                     if mesh_data:
-                        bpy.data.meshes.remove(mesh_data, do_unlink=True)
+                        data_meshes.remove(mesh_data, do_unlink=True)
                 except RuntimeError:
                     pass
         for obj, orig_name in renamed_objects:
-            if object_is_valid(obj):
+            if object_is_valid(obj, data_objects):
                 try:
                     obj.name = orig_name
                 except RuntimeError:
                     pass
-        for obj in prev_selected:
-            try:
-                obj.select_set(True)
-            except ReferenceError:
-                continue
-        bpy.context.view_layer.objects.active = prev_active
     return True
 
 
@@ -2293,8 +2919,7 @@ def mesh_triangle_count(obj):
         return 0
     mesh = obj.data
     try:
-        mesh.calc_loop_triangles()
-        return len(mesh.loop_triangles)
+        return max(len(mesh.loops) - 2 * len(mesh.polygons), 0)
     except Exception:
         try:
             return len(mesh.polygons)
@@ -2309,29 +2934,24 @@ def split_meshes_by_triangles(objects):
     if len(mesh_items) == 1:
         return [mesh_items[0][0]], []
     mesh_items.sort(key=lambda item: item[1])
-    if mesh_items[0][1] == mesh_items[-1][1]:
-        return [obj for obj, _ in mesh_items], []
-    best_index = 0
-    best_gap = -1
-    for idx in range(len(mesh_items) - 1):
-        gap = mesh_items[idx + 1][1] - mesh_items[idx][1]
-        if gap > best_gap:
-            best_gap = gap
-            best_index = idx
-    low = [obj for obj, _ in mesh_items[:best_index + 1]]
-    high = [obj for obj, _ in mesh_items[best_index + 1:]]
-    return low, high
-
-
-def collect_high_poly_objects(context, prefs, low_objects):
-    candidates = collect_high_poly_candidates(context, prefs)
+    objs = [obj for obj, _ in mesh_items]
+    counts = [count for _, count in mesh_items]
+    if counts[0] == counts[-1]:
+        return objs, []
+    gaps = [b - a for a, b in zip(counts, counts[1:])]
+    best_index = gaps.index(max(gaps))
+    return objs[:best_index + 1], objs[best_index + 1:]
+
+
+def collect_high_poly_objects(context, prefs, low_objects, mesh_index=None):
+    candidates = collect_high_poly_candidates(context, prefs, mesh_index=mesh_index)
     if not low_objects:
         return candidates
-    low_set = {obj.name for obj in low_objects}
-    return [obj for obj in candidates if obj.name not in low_set]
+    low_set = {obj.as_pointer() for obj in low_objects}
+    return [obj for obj in candidates if obj.as_pointer() not in low_set]
 
 
-def collect_high_poly_candidates(context, prefs):
+def collect_high_poly_candidates(context, prefs, mesh_index=None):
     scene = context.scene
     objects = []
     selected_only = bool(prefs and getattr(prefs, "export_selected_only", False))
@@ -2352,34 +2972,58 @@ def collect_high_poly_candidates(context, prefs):
         if objects:
             return objects
     suffixes = parse_suffixes(getattr(prefs, "high_poly_suffixes", ""))
+    meshes = scene_meshes(context, mesh_index)
     if suffixes:
-        for obj in context.scene.objects:
-            if obj.type != "MESH":
-                continue
+        for obj in meshes:
             if is_name_with_suffix(obj.name, suffixes):
                 objects.append(obj)
-    for obj in context.scene.objects:
-        if obj.type == "MESH" and obj.get("gob_high_poly"):
+    for obj in meshes:
+        if obj.get("gob_high_poly"):
             objects.append(obj)
     if selected_only and selected_names:
         objects = [obj for obj in objects if obj.name in selected_names]
     unique = []
     seen = set()
     for obj in objects:
-        if obj.name in seen:
+        key = obj.as_pointer()
+        if key in seen:
             continue
-        seen.add(obj.name)
+        seen.add(key)
         unique.append(obj)
     return unique
 
 
 def import_fbx(filepath):
-    before = {obj.name for obj in bpy.data.objects}
+    data_objects = bpy.data.objects
+    before = {obj.as_pointer() for obj in data_objects}
     bpy.ops.import_scene.fbx(filepath=str(filepath))
-    return [obj for obj in bpy.data.objects if obj.name not in before]
+    return [obj for obj in data_objects if obj.as_pointer() not in before]
 
 
 def find_sp_exe(_prefs):
+    key = (
+        os.environ.get("SUBSTANCE_PAINTER_EXE"),
+        os.environ.get("ADOBE_SUBSTANCE_PAINTER_EXE"),
+        os.environ.get("ProgramFiles"),
+        os.environ.get("ProgramFiles(x86)"),
+        sys.platform,
+    )
+    cached = _sp_exe_cache.get(key)
+    if cached and os.path.exists(cached):
+        return cached
+    result = _locate_sp_exe()
+    if result:
+        _sp_exe_cache[key] = result
+    else:
+        _sp_exe_cache.pop(key, None)
+    return result
+
+
+def clear_sp_exe_cache():
+    _sp_exe_cache.clear()
+
+
+def _locate_sp_exe():
     for env_var in ("SUBSTANCE_PAINTER_EXE", "ADOBE_SUBSTANCE_PAINTER_EXE"):
         env_path = os.environ.get(env_var)
         if env_path:
@@ -2452,12 +3096,12 @@ def open_sp_project_file(project_file, sp_exe=None):
                 subprocess.Popen(["open", project_file])
             return True
         if os.name == "nt":
-            if sp_exe and Path(sp_exe).is_file():
+            if sp_exe and os.path.isfile(sp_exe):
                 subprocess.Popen([sp_exe, project_file])
             else:
                 os.startfile(project_file)
             return True
-        if sp_exe and Path(sp_exe).is_file():
+        if sp_exe and os.path.isfile(sp_exe):
             subprocess.Popen([sp_exe, project_file])
         else:
             subprocess.Popen(["xdg-open", project_file])
@@ -2538,7 +3182,75 @@ def open_path_in_file_manager(path):
         return False
 
 
-def is_sp_running():
+def is_sp_running(force=False):
+    global _sp_running_cache
+    now = time.monotonic()
+    checked_at, running = _sp_running_cache
+    if not force and now - checked_at < SP_RUNNING_TTL:
+        return running
+    running = _query_sp_running()
+    _sp_running_cache = (now, running)
+    return running
+
+
+@lru_cache(maxsize=1)
+def _toolhelp_api():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", ctypes.c_wchar * 260),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    entry_ptr = ctypes.POINTER(PROCESSENTRY32W)
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, entry_ptr]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, entry_ptr]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    invalid_handle = ctypes.c_void_p(-1).value
+    return ctypes, kernel32, PROCESSENTRY32W, invalid_handle
+
+
+def _toolhelp_process_running(names):
+    ctypes, kernel32, entry_type, invalid_handle = _toolhelp_api()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == invalid_handle:
+        raise OSError("CreateToolhelp32Snapshot failed")
+    try:
+        entry = entry_type()
+        entry.dwSize = ctypes.sizeof(entry_type)
+        entry_ref = ctypes.byref(entry)
+        ok = kernel32.Process32FirstW(snapshot, entry_ref)
+        while ok:
+            if entry.szExeFile in names:
+                return True
+            ok = kernel32.Process32NextW(snapshot, entry_ref)
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return False
+
+
+def _query_sp_running():
+    if os.name == "nt":
+        try:
+            return _toolhelp_process_running(SP_PROCESS_NAMES)
+        except (AttributeError, ImportError, OSError):
+            pass
     try:
         output = subprocess.check_output(
             ["tasklist", "/FO", "CSV"],
@@ -2548,12 +3260,12 @@ def is_sp_running():
         )
     except OSError:
         return False
-    return ("Adobe Substance 3D Painter.exe" in output or
-            "Substance 3D Painter.exe" in output)
+    return any(name in output for name in SP_PROCESS_NAMES)
 
 
 _update_check_in_progress = False
 _update_check_result = None
+_update_check_done = threading.Event()
 _update_check_show_no_update = False
 _update_check_show_popup = False
 _last_update_info = None
@@ -2561,11 +3273,15 @@ _update_status_kind = "idle"
 _update_status_text = "Update: not checked yet"
 _update_status_time = 0.0
 _last_export_warning = ""
-_pending_export_popup = False
+_ui_popup_queue = deque()
 _cache_size_check_time = 0.0
 _cache_size_global = 0
 _cache_size_local = 0
 _cache_size_project_root = None
+_cache_size_refreshing = False
+_cache_size_pending_result = None
+_cache_size_generation = 0
+_cache_size_started_at = 0.0
 
 
 def _set_update_status(kind, text, info=None):
@@ -2582,9 +3298,10 @@ def _set_update_status(kind, text, info=None):
         _last_update_info = None
 
 
-def _update_worker():
+def _update_worker(force=False):
     global _update_check_result
-    _update_check_result = check_for_updates()
+    _update_check_result = check_for_updates(force=force)
+    _update_check_done.set()
 
 
 def _show_update_popup(info):
@@ -2631,20 +3348,27 @@ def _set_export_warning(message):
     _last_export_warning = message or ""
 
 
-def _queue_export_warning_popup(message):
-    global _pending_export_popup
-    if _pending_export_popup:
+def _drain_popups():
+    while _ui_popup_queue:
+        title, message, icon = _ui_popup_queue.popleft()
+        _show_simple_popup(title, message, icon=icon)
+    return None
+
+
+def _queue_simple_popup(title, message, icon="INFO"):
+    if not message:
+        return
+    entry = (title, message, icon)
+    if entry in _ui_popup_queue:
         return
-    _pending_export_popup = True
+    _ui_popup_queue.append(entry)
+    if threading.current_thread() is not threading.main_thread():
+        return
+    _ensure_timer(_drain_popups, 0.0)
 
-    def _show_popup():
-        global _pending_export_popup
-        _pending_export_popup = False
-        if message:
-            _show_simple_popup("GoB SP Bridge", message, icon="ERROR")
-        return None
 
-    bpy.app.timers.register(_show_popup, first_interval=0.01)
+def _queue_export_warning_popup(message):
+    _queue_simple_popup("GoB SP Bridge", message, icon="ERROR")
 
 
 def _enforce_selected_suffix_policy(context, prefs, operator=None):
@@ -2672,20 +3396,20 @@ def _enforce_selected_suffix_policy(context, prefs, operator=None):
             operator.report({"WARNING"}, message)
         _queue_export_warning_popup(message)
         return False
-    low_suffixes = parse_suffixes(prefs.low_poly_suffixes) or ["_low"]
-    high_suffixes = parse_suffixes(prefs.high_poly_suffixes) or ["_high"]
+    low_suffixes = parse_suffixes(prefs.low_poly_suffixes) or ("_low",)
+    high_suffixes = parse_suffixes(prefs.high_poly_suffixes) or ("_high",)
     has_low = False
     has_high = False
     has_unknown = False
     for obj in selected_meshes:
-        is_low = is_name_with_suffix(obj.name, low_suffixes)
-        is_high = is_name_with_suffix(obj.name, high_suffixes)
-        if is_low:
-            has_low = True
-        if is_high:
-            has_high = True
+        lname = obj.name.lower()
+        is_low = _lower_name_has_suffix(lname, low_suffixes)
+        is_high = _lower_name_has_suffix(lname, high_suffixes)
         if not (is_low or is_high):
             has_unknown = True
+            break
+        has_low = has_low or is_low
+        has_high = has_high or is_high
     if has_low and has_high and not has_unknown:
         _set_export_warning("")
         return True
@@ -2756,7 +3480,7 @@ def _on_auto_clear_cache_update(self, _context):
         "Warning: auto-clear removes cached projects (keeps the current project) "
         f"when total cache exceeds {limit:.1f} GB."
     )
-    _show_simple_popup("GoB SP Bridge", message)
+    _queue_simple_popup("GoB SP Bridge", message)
 
 
 def _update_poll():
@@ -2764,11 +3488,13 @@ def _update_poll():
     global _update_check_result
     global _update_check_show_no_update
     global _update_check_show_popup
-    if _update_check_result is None:
+    if not _update_check_done.is_set():
         return 0.5
+    _update_check_done.clear()
     result = _update_check_result
     _update_check_result = None
     _update_check_in_progress = False
+    _drain_popups()
     if result.get("status") == "update":
         info = result.get("info")
         _set_update_status("update", f"Update available: {info['version']}", info=info)
@@ -2794,8 +3520,9 @@ def _update_poll():
     return None
 
 
-def start_update_check(show_no_update=False, show_popup=True):
+def start_update_check(show_no_update=False, show_popup=True, force=False):
     global _update_check_in_progress
+    global _update_check_result
     global _update_check_show_no_update
     global _update_check_show_popup
     if _update_check_in_progress:
@@ -2803,35 +3530,124 @@ def start_update_check(show_no_update=False, show_popup=True):
     _update_check_in_progress = True
     _update_check_show_no_update = show_no_update
     _update_check_show_popup = show_popup
+    if not force and time.monotonic() < _update_cache["expires"]:
+        _update_check_result = _update_cache["value"]
+        _update_check_done.set()
+        bpy.app.timers.register(_update_poll, first_interval=0.0)
+        return
     _set_update_status("checking", "Update: checking...")
-    thread = threading.Thread(target=_update_worker, daemon=True)
+    thread = threading.Thread(target=_update_worker, kwargs={"force": force}, daemon=True)
     thread.start()
     bpy.app.timers.register(_update_poll, first_interval=0.5)
 
 
-def get_cached_cache_sizes(context, prefs, max_age=5.0):
+def _cache_size_worker(generation, bridge_root, project_dir, limit_bytes):
+    global _cache_size_pending_result
+    try:
+        total, local = _cache_sizes_for_paths(bridge_root, project_dir)
+    except Exception:
+        total, local = _cache_size_global, _cache_size_local
+    over_limit = bool(limit_bytes and total > limit_bytes)
+    _cache_size_pending_result = (generation, str(project_dir), total, local, time.time(), over_limit)
+
+
+def _auto_clear_cache():
+    global _cache_size_check_time
+    if _bridge_ops_running:
+        return
+    context = bpy.context
+    prefs = get_prefs(context) if context else None
+    if not prefs or not prefs.auto_clear_cache:
+        return
+    keep_paths = [get_project_dir(context, prefs)]
+    result = clear_cache_dir_except(get_bridge_root(prefs), keep_paths=keep_paths)
+    if result == "cleared":
+        _cache_size_check_time = 0.0
+
+
+def _tag_view3d_redraw():
+    window_manager = getattr(bpy.context, "window_manager", None)
+    if not window_manager:
+        return
+    for window in window_manager.windows:
+        screen = window.screen
+        if not screen:
+            continue
+        for area in screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+def _cache_size_poll():
+    global _cache_size_refreshing
+    global _cache_size_pending_result
     global _cache_size_check_time
     global _cache_size_global
     global _cache_size_local
     global _cache_size_project_root
+    global _cache_size_generation
+    result = _cache_size_pending_result
+    if result is None:
+        if time.time() - _cache_size_started_at < CACHE_SIZE_POLL_TIMEOUT:
+            return 0.25
+        _cache_size_generation += 1
+        _cache_size_refreshing = False
+        return None
+    _cache_size_pending_result = None
+    _cache_size_refreshing = False
+    _drain_popups()
+    generation, project_dir, total, local, checked_at, over_limit = result
+    if generation == _cache_size_generation:
+        changed = (total, local) != (_cache_size_global, _cache_size_local)
+        _cache_size_project_root = project_dir
+        _cache_size_global = total
+        _cache_size_local = local
+        _cache_size_check_time = checked_at
+        if over_limit:
+            _auto_clear_cache()
+        if changed:
+            _tag_view3d_redraw()
+    return None
+
+
+def _cache_size_timer():
+    if _bridge_ops_running:
+        return CACHE_SIZE_TIMER_INTERVAL
+    context = bpy.context
+    prefs = get_prefs(context) if context else None
+    if not prefs:
+        return CACHE_SIZE_TIMER_INTERVAL
+    auto_clear = prefs.auto_clear_cache
+    if auto_clear or prefs.ui_show_cache:
+        get_cached_cache_sizes(context, prefs, max_age=_CACHE_TTL[auto_clear])
+    return CACHE_SIZE_TIMER_INTERVAL
+
+
+def get_cached_cache_sizes(context, prefs, max_age=5.0, blender_file=None):
+    global _cache_size_refreshing
+    global _cache_size_pending_result
+    global _cache_size_started_at
     now = time.time()
-    project_dir = str(get_project_dir(context, prefs))
+    project_dir = str(get_project_dir(context, prefs, blender_file))
+    if _cache_size_refreshing:
+        return _cache_size_global, _cache_size_local
     if (
         _cache_size_project_root != project_dir
         or now - _cache_size_check_time > max_age
     ):
-        _cache_size_project_root = project_dir
-        _cache_size_global = bridge_cache_size_bytes(prefs)
-        _cache_size_local = project_cache_size_bytes(context, prefs)
-        if prefs and getattr(prefs, "auto_clear_cache", False):
-            limit_bytes = cache_limit_bytes(prefs)
-            if limit_bytes and _cache_size_global > limit_bytes:
-                keep_paths = [get_project_dir(context, prefs)]
-                result = clear_cache_dir_except(get_bridge_root(prefs), keep_paths=keep_paths)
-                if result == "cleared":
-                    _cache_size_global = bridge_cache_size_bytes(prefs)
-                    _cache_size_local = project_cache_size_bytes(context, prefs)
-        _cache_size_check_time = now
+        auto_clear = bool(prefs and getattr(prefs, "auto_clear_cache", False))
+        limit_bytes = cache_limit_bytes(prefs) if auto_clear else 0
+        _cache_size_refreshing = True
+        _cache_size_pending_result = None
+        _cache_size_started_at = now
+        _submit_io(
+            _cache_size_worker,
+            _cache_size_generation,
+            get_bridge_root(prefs),
+            project_dir,
+            limit_bytes,
+        )
+        bpy.app.timers.register(_cache_size_poll, first_interval=0.1)
     return _cache_size_global, _cache_size_local
 
 
@@ -2840,10 +3656,11 @@ def refresh_cache_sizes(context, prefs):
     global _cache_size_global
     global _cache_size_local
     global _cache_size_project_root
+    global _cache_size_generation
+    _cache_size_generation += 1
     project_dir = str(get_project_dir(context, prefs))
     _cache_size_project_root = project_dir
-    _cache_size_global = bridge_cache_size_bytes(prefs)
-    _cache_size_local = project_cache_size_bytes(context, prefs)
+    _cache_size_global, _cache_size_local = cache_sizes_bytes(context, prefs, project_dir)
     _cache_size_check_time = time.time()
 
 
@@ -2972,33 +3789,52 @@ class GOB_OT_SendToSP(Operator):
     bl_label = "Send to Substance Painter"
 
     def execute(self, context):
+        with bridge_operation(), bridge_index_session():
+            return self._execute(context)
+
+    def _execute(self, context):
         prefs = get_prefs(context)
-        write_active_blender_info(context, prefs)
         blender_file = get_blender_file_path_or_temp(prefs)
+        current_project_dir = get_project_dir(context, prefs, blender_file)
+        write_active_blender_info(
+            context,
+            prefs,
+            blender_file=blender_file,
+            project_dir=current_project_dir,
+        )
         force_new_project = bool(prefs and prefs.force_new_sp_project_on_send)
         _enforce_selected_suffix_policy(context, prefs, operator=self)
-        if prefs and prefs.export_selected_only and prefs.experimental_auto_split_selected:
+        export_selected = bool(prefs and prefs.export_selected_only)
+        export_high = bool(prefs and prefs.export_high_poly)
+        export_low = not prefs or prefs.export_low_poly
+        if export_selected and prefs.experimental_auto_split_selected:
             selected_meshes = [obj for obj in context.selected_objects if obj.type == "MESH"]
             low_objects, high_candidates = split_meshes_by_triangles(selected_meshes)
         else:
-            low_objects = collect_low_poly_objects(context, prefs)
+            mesh_index = scene_mesh_index(context.scene)
+            low_objects = collect_low_poly_objects(context, prefs, mesh_index=mesh_index)
             high_candidates = []
-            if prefs and prefs.export_high_poly:
-                high_candidates = collect_high_poly_candidates(context, prefs)
-        if prefs and prefs.export_high_poly and high_candidates and low_objects:
-            high_names = {obj.name for obj in high_candidates}
-            low_objects = [obj for obj in low_objects if obj.name not in high_names]
-        if not low_objects and (not prefs or prefs.export_low_poly):
+            if export_high:
+                high_candidates = collect_high_poly_candidates(
+                    context, prefs, mesh_index=mesh_index
+                )
+        high_pointers = ()
+        if export_high and high_candidates:
+            high_pointers = {obj.as_pointer() for obj in high_candidates}
+        filtered_low = []
+        for obj in low_objects:
+            if obj.as_pointer() in high_pointers:
+                continue
+            if not object_has_uvs(obj):
+                self.report({"ERROR"}, "Missing UVs: unwrap in Blender before export")
+                return {"CANCELLED"}
+            filtered_low.append(obj)
+        low_objects = filtered_low
+        if not low_objects and export_low:
             self.report({"ERROR"}, "Select or name at least one low poly mesh")
             return {"CANCELLED"}
 
-        if low_objects and any(not object_has_uvs(obj) for obj in low_objects):
-            self.report({"ERROR"}, "Missing UVs: unwrap in Blender before export")
-            return {"CANCELLED"}
-
-        high_signature_objects = []
-        if prefs and prefs.export_high_poly:
-            high_signature_objects = high_candidates
+        high_signature_objects = high_candidates if export_high else []
         mesh_signature = build_mesh_signature(low_objects, high_signature_objects)
         signature_manifest = None
         signature_project_dir = None
@@ -3015,7 +3851,12 @@ class GOB_OT_SendToSP(Operator):
                 signature_manifest = read_manifest(signature_manifest_path)
                 signature_sp_project = get_manifest_sp_project_file(signature_manifest)
 
-        active_info = resolve_active_sp_project_info(context, prefs)
+        active_info = resolve_active_sp_project_info(
+            context,
+            prefs,
+            blender_file=blender_file,
+            project_dir=current_project_dir,
+        )
         if force_new_project:
             active_info = None
         if signature_project_dir:
@@ -3038,6 +3879,9 @@ class GOB_OT_SendToSP(Operator):
         ensure_dir(project_dir)
 
         export_path = project_dir / BLENDER_EXPORT_FILENAME
+        export_path_str = str(export_path)
+        high_path = project_dir / BLENDER_HIGH_FILENAME
+        manifest_path = project_manifest_path(project_dir)
         old_manifest = read_manifest(find_project_manifest_path(project_dir))
         old_mesh = old_manifest.get("mesh_fbx") if old_manifest else None
         linked_sp_project_hint = signature_sp_project or get_linked_sp_project_path(
@@ -3070,7 +3914,7 @@ class GOB_OT_SendToSP(Operator):
         if sp_project_file and blender_file and not force_new_project:
             update_link_registry(sp_project_file=sp_project_file, blender_file=blender_file, prefs=prefs)
 
-        if not prefs or prefs.export_low_poly:
+        if export_low:
             if not low_objects:
                 self.report({"ERROR"}, "Low poly export enabled but no meshes found")
                 return {"CANCELLED"}
@@ -3086,29 +3930,25 @@ class GOB_OT_SendToSP(Operator):
             return {"CANCELLED"}
 
         high_export_path = None
-        if prefs and prefs.export_high_poly:
+        if export_high:
             high_objects = high_candidates
             if high_objects:
-                high_export_path = project_dir / BLENDER_HIGH_FILENAME
+                high_export_path = high_path
                 exported = export_fbx_objects(high_export_path, high_objects, prefs=prefs)
                 if not exported or not high_export_path.exists():
                     self.report({"WARNING"}, "High poly export failed or produced no FBX")
                     high_export_path = None
 
-        force_new_token = ""
-        if force_new_project:
-            force_new_token = uuid.uuid4().hex
-
-        manifest_path = project_manifest_path(project_dir)
         if manifest_path:
             ensure_dir(manifest_path.parent)
         sp_running = is_sp_running()
+        now = time.time()
         manifest = {
             "version": 1,
             "source": "blender",
             "project": get_project_name(context),
-            "mesh_fbx": str(export_path) if (not prefs or prefs.export_low_poly) else old_mesh,
-            "timestamp": time.time(),
+            "mesh_fbx": export_path_str if export_low else old_mesh,
+            "timestamp": now,
         }
         if mesh_signature:
             manifest["mesh_signature"] = mesh_signature
@@ -3120,15 +3960,18 @@ class GOB_OT_SendToSP(Operator):
                 manifest["blender_file"] = previous_blender_file
         if linked_sp_project_hint:
             manifest["sp_project_file"] = linked_sp_project_hint
+        force_new_token = ""
         if force_new_project:
+            import uuid
+
+            force_new_token = uuid.uuid4().hex
             manifest["force_new_project"] = True
-            if force_new_token:
-                manifest["force_new_token"] = force_new_token
+            manifest["force_new_token"] = force_new_token
         manifest["auto_import"] = True
-        manifest["auto_import_at"] = time.time()
+        manifest["auto_import_at"] = now
         if high_export_path:
             manifest["high_mesh_fbx"] = str(high_export_path)
-        if prefs and prefs.export_high_poly:
+        if export_high:
             manifest["high_mesh_exported"] = bool(high_export_path)
         write_manifest(manifest_path, manifest)
 
@@ -3138,18 +3981,11 @@ class GOB_OT_SendToSP(Operator):
         active_sp_file = ""
         if active_any:
             active_sp_file = str(active_any.get("sp_project_file") or "")
-        already_open = bool(
-            sp_running
-            and linked_sp_project
-            and active_sp_file
-            and paths_match(active_sp_file, linked_sp_project)
-        )
-        should_force_open = bool(
-            sp_running
-            and linked_sp_project
-            and active_sp_file
-            and not paths_match(active_sp_file, linked_sp_project)
-        )
+        already_open = False
+        should_force_open = False
+        if sp_running and linked_sp_project and active_sp_file:
+            already_open = paths_match(active_sp_file, linked_sp_project)
+            should_force_open = not already_open
         if force_new_project:
             if sp_exe:
                 opened_project = launch_sp_instance(
@@ -3201,14 +4037,24 @@ class GOB_OT_ImportFromSP(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
+        with bridge_operation(), bridge_index_session():
+            return self._execute(context)
+
+    def _execute(self, context):
         prefs = get_prefs(context)
         roots = get_candidate_bridge_roots(prefs)
-        project_dir = get_project_dir(context, prefs)
+        current_blender_file = get_blender_file_path_or_temp(prefs)
+        project_dir = get_project_dir(context, prefs, current_blender_file)
         manifest_path = None
         manifest = None
-        current_blender_file = get_blender_file_path_or_temp(prefs)
+        from_sp = False
         current_is_temp = is_temp_blender_file(current_blender_file, prefs)
-        active_info = resolve_active_sp_project_info(context, prefs)
+        active_info = resolve_active_sp_project_info(
+            context,
+            prefs,
+            blender_file=current_blender_file,
+            project_dir=project_dir,
+        )
         if not active_info and (not current_blender_file or current_is_temp):
             active_info = find_active_sp_project_info(prefs)
         sp_project_file = active_info.get("sp_project_file") if active_info else ""
@@ -3226,29 +4072,26 @@ class GOB_OT_ImportFromSP(Operator):
                     if manifest_blender and not paths_match(manifest_blender, current_blender_file):
                         manifest = None
                         manifest_path = None
-        if not manifest or manifest.get("source") != "substance_painter":
-            blender_file = current_blender_file
-            if blender_file:
-                candidate = find_manifest_for_blender_file(
-                    roots,
-                    blender_file,
-                    source="substance_painter",
-                )
-                if candidate:
-                    manifest_path = candidate
-                    manifest = read_manifest(manifest_path)
-        if not manifest or manifest.get("source") != "substance_painter":
-            if not bpy.data.filepath:
-                candidate = find_project_manifest_path(project_dir)
-                if candidate and candidate.exists():
-                    manifest_path = candidate
-                    manifest = read_manifest(manifest_path)
-        if not manifest or manifest.get("source") != "substance_painter":
+                from_sp = bool(manifest) and manifest.get("source") == "substance_painter"
+        if not from_sp and current_blender_file:
+            candidate = find_manifest_for_blender_file(
+                roots,
+                current_blender_file,
+                source="substance_painter",
+            )
+            if candidate and candidate != manifest_path:
+                manifest_path = candidate
+                manifest = read_manifest(manifest_path)
+                from_sp = bool(manifest) and manifest.get("source") == "substance_painter"
+        if not from_sp and not bpy.data.filepath:
+            candidate = find_project_manifest_path(project_dir)
+            if candidate and candidate != manifest_path and candidate.exists():
+                manifest_path = candidate
+                manifest = read_manifest(manifest_path)
+                from_sp = bool(manifest) and manifest.get("source") == "substance_painter"
+        if not from_sp:
             self.report({"ERROR"}, "No Substance Painter bridge manifest found for this project")
             return {"CANCELLED"}
-        if not manifest:
-            self.report({"ERROR"}, "Failed to read bridge manifest")
-            return {"CANCELLED"}
         project_dir = project_dir_from_manifest_path(manifest_path)
         sp_project_file = get_manifest_sp_project_file(manifest)
         link_sp_project_file = get_manifest_link_sp_project_file(manifest)
@@ -3278,36 +4121,37 @@ class GOB_OT_ImportFromSP(Operator):
             if fallback.exists():
                 mesh_path = str(fallback)
         new_objects = []
-        if mesh_path and Path(mesh_path).is_file():
+        if mesh_path and os.path.isfile(mesh_path):
             new_objects = import_fbx(mesh_path)
 
         texture_paths = gather_texture_paths(manifest)
         targets = list(new_objects)
-        signature_targets = find_signature_targets(context, manifest)
+        mesh_index = scene_mesh_index(context.scene)
+        signature_targets = find_signature_targets(context, manifest, mesh_index=mesh_index)
         if signature_targets:
-            existing = {obj.name for obj in targets}
+            existing = {obj.as_pointer() for obj in targets}
             for obj in signature_targets:
-                if obj.name not in existing:
+                key = obj.as_pointer()
+                if key not in existing:
                     targets.append(obj)
-                    existing.add(obj.name)
+                    existing.add(key)
         grouped = group_textures(texture_paths) if texture_paths else {}
         strict = False
         if grouped:
-            matched_targets = find_texture_targets(context, grouped)
+            matched_targets = find_texture_targets(context, grouped, mesh_index=mesh_index)
             if matched_targets:
                 if targets:
-                    existing = {obj.name for obj in targets}
+                    existing = {obj.as_pointer() for obj in targets}
                     for obj in matched_targets:
-                        if obj.name not in existing:
+                        key = obj.as_pointer()
+                        if key not in existing:
                             targets.append(obj)
-                            existing.add(obj.name)
+                            existing.add(key)
                 else:
                     targets = matched_targets
         if not targets and grouped:
-            targets = find_texture_targets(context, grouped)
-            if not targets:
-                targets = [obj for obj in context.scene.objects if obj.type == "MESH"]
-                strict = True
+            targets = list(mesh_index["meshes"])
+            strict = True
         if not targets and grouped:
             self.report(
                 {"WARNING"},
@@ -3343,6 +4187,10 @@ class GOB_OT_ClearCacheGlobal(Operator):
     bl_label = "Clear Global Cache"
 
     def execute(self, context):
+        with bridge_operation():
+            return self._execute(context)
+
+    def _execute(self, context):
         prefs = get_prefs(context)
         root = get_bridge_root(prefs)
         result = clear_cache_dir(root)
@@ -3367,6 +4215,10 @@ class GOB_OT_ClearCacheLocal(Operator):
     bl_label = "Clear Project Cache"
 
     def execute(self, context):
+        with bridge_operation():
+            return self._execute(context)
+
+    def _execute(self, context):
         prefs = get_prefs(context)
         root = get_project_dir(context, prefs)
         result = clear_cache_dir(root)
@@ -3409,7 +4261,7 @@ class GOB_OT_CheckUpdates(Operator):
     bl_label = "Check for Updates"
 
     def execute(self, _context):
-        start_update_check(show_no_update=True, show_popup=True)
+        start_update_check(show_no_update=True, show_popup=True, force=True)
         return {"FINISHED"}
 
 
@@ -3424,6 +4276,42 @@ class GOB_OT_OpenUpdateURL(Operator):
         return {"FINISHED"}
 
 
+def _build_link_cache(now, prefs, blender_file, project_dir, project_dir_str, previous):
+    active_info = read_active_sp_info(project_meta_dir(project_dir) / ACTIVE_SP_INFO_FILENAME)
+    if not active_info:
+        active_info = find_active_sp_project_info(prefs)
+    link_key = (
+        blender_file,
+        project_dir_str,
+        str(active_info.get("sp_project_file") or "") if active_info else "",
+        str(active_info.get("project_dir") or "") if active_info else "",
+    )
+    resolved_at = previous.get("resolved_at", 0.0)
+    if link_key == previous.get("link_key") and now - resolved_at < UI_LINK_STATE_MAX_AGE:
+        auto_sp_project = previous["auto_sp_project"]
+        linked_sp_project = previous["linked_sp_project"]
+        auto_is_temp = previous["auto_is_temp"]
+        auto_exists = previous["auto_exists"]
+    else:
+        auto_sp_project, linked_sp_project, auto_is_temp, auto_exists = _resolve_link_state(
+            project_dir, active_info, blender_file, prefs
+        )
+        resolved_at = now
+    return {
+        "timestamp": now,
+        "blender_file": blender_file,
+        "project_dir": project_dir_str,
+        "project_path": project_dir,
+        "active_info": active_info,
+        "auto_sp_project": auto_sp_project,
+        "linked_sp_project": linked_sp_project,
+        "auto_is_temp": auto_is_temp,
+        "auto_exists": auto_exists,
+        "link_key": link_key,
+        "resolved_at": resolved_at,
+    }
+
+
 class GOB_PT_Panel(Panel):
     bl_label = "GoB SP Bridge"
     bl_idname = "GOB_PT_sp_bridge"
@@ -3435,65 +4323,38 @@ class GOB_PT_Panel(Panel):
         layout = self.layout
         prefs = get_prefs(context)
         scene = context.scene
-        active_info = None
-        project_dir = ""
-        blender_file = ""
+        try:
+            show_export = scene.gob_sp_ui_show_export_settings
+        except AttributeError:
+            return
         auto_sp_project = ""
         linked_sp_project = ""
         auto_exists = False
         auto_is_temp = False
-        if prefs:
+        show_link = bool(prefs and prefs.ui_show_project_link)
+        if show_export and show_link:
             global _ui_link_cache
             now = time.time()
             blender_file = get_blender_file_path_or_temp(prefs)
             project_dir = get_project_dir_fast(context, prefs)
+            if project_dir is _ui_link_cache.get("project_path"):
+                project_dir_str = _ui_link_cache["project_dir"]
+            else:
+                project_dir_str = str(project_dir)
             cache_ok = (
                 now - _ui_link_cache.get("timestamp", 0.0) < UI_LINK_CACHE_TTL
                 and _ui_link_cache.get("blender_file") == blender_file
-                and _ui_link_cache.get("project_dir") == str(project_dir)
+                and _ui_link_cache.get("project_dir") == project_dir_str
             )
-            if cache_ok:
-                active_info = _ui_link_cache.get("active_info")
-                auto_sp_project = _ui_link_cache.get("auto_sp_project", "")
-                linked_sp_project = _ui_link_cache.get("linked_sp_project", "")
-                auto_exists = bool(_ui_link_cache.get("auto_exists"))
-                auto_is_temp = bool(_ui_link_cache.get("auto_is_temp"))
-            else:
-                active_info = read_active_sp_info(
-                    project_meta_dir(project_dir) / ACTIVE_SP_INFO_FILENAME
-                )
-                if not active_info:
-                    active_info = find_active_sp_project_info(prefs)
-                auto_sp_project = get_linked_sp_project_path_fast(
-                    project_dir,
-                    active_info=active_info,
-                    blender_file=blender_file,
-                    prefs=prefs,
-                )
-                linked_sp_project = resolve_linked_sp_project_file_fast(
-                    project_dir,
-                    active_info=active_info,
-                    blender_file=blender_file,
-                    prefs=prefs,
+            if not cache_ok:
+                _ui_link_cache = _build_link_cache(
+                    now, prefs, blender_file, project_dir, project_dir_str, _ui_link_cache
                 )
-                if auto_sp_project:
-                    auto_is_temp = is_temp_sp_project_file(auto_sp_project, prefs)
-                    if not auto_is_temp:
-                        try:
-                            auto_exists = Path(auto_sp_project).is_file()
-                        except OSError:
-                            auto_exists = False
-                _ui_link_cache = {
-                    "timestamp": now,
-                    "blender_file": blender_file,
-                    "project_dir": str(project_dir),
-                    "active_info": active_info,
-                    "auto_sp_project": auto_sp_project,
-                    "linked_sp_project": linked_sp_project,
-                    "auto_is_temp": auto_is_temp,
-                    "auto_exists": auto_exists,
-                }
-        show_export = getattr(scene, "gob_sp_ui_show_export_settings", True)
+            link_cache = _ui_link_cache
+            auto_sp_project = link_cache["auto_sp_project"]
+            linked_sp_project = link_cache["linked_sp_project"]
+            auto_exists = link_cache["auto_exists"]
+            auto_is_temp = link_cache["auto_is_temp"]
         row = layout.row(align=True)
         row.operator(GOB_OT_SendToSP.bl_idname, icon="EXPORT")
         row.operator(GOB_OT_ImportFromSP.bl_idname, icon="IMPORT")
@@ -3505,6 +4366,8 @@ class GOB_PT_Panel(Panel):
             row.prop(scene, "gob_sp_ui_show_export_settings", icon=icon,
                      emboss=False, text="Send to Painter")
             if show_export:
+                bpy_data = bpy.data
+                export_high = prefs.export_high_poly
                 scope_box = export_box.box()
                 scope_box.label(text="Mesh Selection")
                 scope_col = scope_box.column(align=True)
@@ -3516,7 +4379,7 @@ class GOB_PT_Panel(Panel):
                     "experimental_auto_split_selected",
                     text="Auto-split Selected (experimental)",
                 )
-                if prefs.export_high_poly:
+                if export_high:
                     id_box = export_box.box()
                     id_box.label(text="Low/High Identification")
                     if prefs.export_selected_only and prefs.experimental_auto_split_selected:
@@ -3526,20 +4389,8 @@ class GOB_PT_Panel(Panel):
                         info.label(text="Higher triangle meshes export as high")
                     else:
                         id_col = id_box.column(align=True)
-                        id_col.prop_search(
-                            scene,
-                            "gob_sp_low_poly_collection",
-                            bpy.data,
-                            "collections",
-                            text="Low Collection",
-                        )
-                        id_col.prop_search(
-                            scene,
-                            "gob_sp_high_poly_collection",
-                            bpy.data,
-                            "collections",
-                            text="High Collection",
-                        )
+                        for attr, label in _HIGH_ID_ROWS:
+                            id_col.prop_search(scene, attr, bpy_data, "collections", text=label)
                         and_or_row = id_col.row()
                         and_or_row.alignment = "CENTER"
                         and_or_row.label(text="AND/OR")
@@ -3552,13 +4403,8 @@ class GOB_PT_Panel(Panel):
                     id_box = export_box.box()
                     id_box.label(text="Low Identification")
                     id_col = id_box.column(align=True)
-                    id_col.prop_search(
-                        scene,
-                        "gob_sp_low_poly_collection",
-                        bpy.data,
-                        "collections",
-                        text="Low Collection",
-                    )
+                    for attr, label in _LOW_ID_ROWS:
+                        id_col.prop_search(scene, attr, bpy_data, "collections", text=label)
                     and_or_row = id_col.row()
                     and_or_row.alignment = "CENTER"
                     and_or_row.label(text="AND/OR")
@@ -3569,16 +4415,14 @@ class GOB_PT_Panel(Panel):
 
                 link_box = export_box.box()
                 row = link_box.row()
-                icon = "TRIA_DOWN" if prefs.ui_show_project_link else "TRIA_RIGHT"
+                icon = "TRIA_DOWN" if show_link else "TRIA_RIGHT"
                 row.prop(prefs, "ui_show_project_link", icon=icon, emboss=False, text="Project Link")
-                if prefs.ui_show_project_link:
-                    if auto_sp_project and auto_is_temp:
-                        link_box.label(text="Linked SP project is unsaved", icon="INFO")
-                        link_box.label(text=f"Detected: {auto_sp_project}", icon="INFO")
-                    elif auto_sp_project and not auto_exists:
-                        link_box.label(text="Linked SP project not found", icon="INFO")
-                        link_box.label(text=f"Detected: {auto_sp_project}", icon="INFO")
-                    elif auto_sp_project:
+                if show_link:
+                    if auto_sp_project:
+                        if auto_is_temp:
+                            link_box.label(text="Linked SP project is unsaved", icon="INFO")
+                        elif not auto_exists:
+                            link_box.label(text="Linked SP project not found", icon="INFO")
                         link_box.label(text=f"Detected: {auto_sp_project}", icon="INFO")
                     else:
                         link_box.label(text="No linked SP project detected", icon="INFO")
@@ -3594,9 +4438,10 @@ class GOB_PT_Panel(Panel):
 
             fbx_box = layout.box()
             row = fbx_box.row()
-            icon = "TRIA_DOWN" if prefs.ui_show_fbx_settings else "TRIA_RIGHT"
+            show_fbx = prefs.ui_show_fbx_settings
+            icon = "TRIA_DOWN" if show_fbx else "TRIA_RIGHT"
             row.prop(prefs, "ui_show_fbx_settings", icon=icon, emboss=False, text="FBX Export Settings")
-            if prefs.ui_show_fbx_settings:
+            if show_fbx:
                 col = fbx_box.column(align=True)
                 col.prop(prefs, "fbx_export_scale")
                 col.prop(prefs, "fbx_apply_unit_scale")
@@ -3604,35 +4449,27 @@ class GOB_PT_Panel(Panel):
                 fbx_box.label(text="Tip: if triangles too small, raise Export Scale")
 
             cache_box = layout.box()
-            cache_refresh = bool(prefs.ui_show_cache or prefs.auto_clear_cache)
-            cache_max_age = 5.0 if prefs.auto_clear_cache else 30.0
-            if cache_refresh:
-                global_size, local_size = get_cached_cache_sizes(
-                    context,
-                    prefs,
-                    max_age=cache_max_age,
-                )
-            else:
-                global_size, local_size = _cache_size_global, _cache_size_local
-            warn_size = format_bytes(CACHE_WARN_BYTES)
-            limit_bytes = cache_limit_bytes(prefs) if prefs.auto_clear_cache else 0
+            global_size, local_size = _cache_size_global, _cache_size_local
+            auto_clear = prefs.auto_clear_cache
+            show_cache = prefs.ui_show_cache
+            limit_bytes = cache_limit_bytes(prefs) if auto_clear else 0
             cache_label = "Cache"
             if limit_bytes and global_size >= limit_bytes:
                 cache_label = f"Cache (over {format_bytes(limit_bytes)})"
-            elif max(global_size, local_size) >= CACHE_WARN_BYTES:
-                cache_label = f"Cache (over {warn_size})"
+            elif global_size >= CACHE_WARN_BYTES or local_size >= CACHE_WARN_BYTES:
+                cache_label = f"Cache (over {format_bytes(CACHE_WARN_BYTES)})"
             row = cache_box.row()
-            icon = "TRIA_DOWN" if prefs.ui_show_cache else "TRIA_RIGHT"
+            icon = "TRIA_DOWN" if show_cache else "TRIA_RIGHT"
             row.prop(prefs, "ui_show_cache", icon=icon, emboss=False, text=cache_label)
-            if prefs.ui_show_cache:
+            if show_cache:
                 cache_box.label(text=f"Global cache: {format_bytes(global_size)}")
                 cache_box.label(text=f"Project cache: {format_bytes(local_size)}")
                 row = cache_box.row()
                 row.prop(prefs, "auto_clear_cache")
                 row = cache_box.row()
-                row.enabled = prefs.auto_clear_cache
+                row.enabled = auto_clear
                 row.prop(prefs, "cache_limit_gb")
-                if prefs.auto_clear_cache:
+                if auto_clear:
                     cache_box.label(text="Auto-clear keeps the current project", icon="INFO")
                 row = cache_box.row(align=True)
                 row.operator(GOB_OT_ClearCacheGlobal.bl_idname, icon="TRASH")
@@ -3663,11 +4500,33 @@ classes = (
     GOB_OT_OpenUpdateURL,
     GOB_PT_Panel,
 )
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
+def _ensure_timer(fn, interval):
+    timers = bpy.app.timers
+    if not timers.is_registered(fn):
+        timers.register(fn, first_interval=interval)
+
+
+def _remove_timer(fn):
+    timers = bpy.app.timers
+    if timers.is_registered(fn):
+        timers.unregister(fn)
+
+
+def _ensure_handler(handler_list, fn):
+    if fn not in handler_list:
+        handler_list.append(fn)
+
+
+def _remove_handler(handler_list, fn):
+    if fn in handler_list:
+        handler_list.remove(fn)
 
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.Scene.gob_sp_ui_show_export_settings = BoolProperty(
         name="Show Export Settings",
         default=True,
@@ -3689,26 +4548,37 @@ def register():
         type=bpy.types.Collection,
         poll=_scene_collection_poll,
     )
-    if _init_scene_ui_prefs not in bpy.app.handlers.load_post:
-        bpy.app.handlers.load_post.append(_init_scene_ui_prefs)
-    if _update_active_blender_info not in bpy.app.handlers.save_post:
-        bpy.app.handlers.save_post.append(_update_active_blender_info)
-    if not bpy.app.timers.is_registered(_init_scene_ui_prefs):
-        bpy.app.timers.register(_init_scene_ui_prefs, first_interval=0.1)
-    if not bpy.app.timers.is_registered(_active_blender_heartbeat):
-        bpy.app.timers.register(_active_blender_heartbeat, first_interval=1.0)
+    handlers = bpy.app.handlers
+    _ensure_handler(handlers.load_post, _init_scene_ui_prefs)
+    _ensure_handler(handlers.load_post, _clear_material_build_cache)
+    _ensure_handler(handlers.save_post, _update_active_blender_info)
+    _ensure_timer(_init_scene_ui_prefs, 0.1)
+    _ensure_timer(_active_blender_heartbeat, 1.0)
+    _ensure_timer(_cache_size_timer, 1.0)
     start_update_check(show_popup=False)
 
 
 def unregister():
-    if _init_scene_ui_prefs in bpy.app.handlers.load_post:
-        bpy.app.handlers.load_post.remove(_init_scene_ui_prefs)
-    if _update_active_blender_info in bpy.app.handlers.save_post:
-        bpy.app.handlers.save_post.remove(_update_active_blender_info)
-    if bpy.app.timers.is_registered(_init_scene_ui_prefs):
-        bpy.app.timers.unregister(_init_scene_ui_prefs)
-    if bpy.app.timers.is_registered(_active_blender_heartbeat):
-        bpy.app.timers.unregister(_active_blender_heartbeat)
+    global _cache_size_refreshing
+    global _cache_size_pending_result
+    global _cache_size_generation
+    handlers = bpy.app.handlers
+    _remove_handler(handlers.load_post, _init_scene_ui_prefs)
+    _remove_handler(handlers.load_post, _clear_material_build_cache)
+    _remove_handler(handlers.save_post, _update_active_blender_info)
+    for timer in (
+        _init_scene_ui_prefs,
+        _active_blender_heartbeat,
+        _cache_size_timer,
+        _cache_size_poll,
+        _drain_popups,
+    ):
+        _remove_timer(timer)
+    _ui_popup_queue.clear()
+    _material_build_cache.clear()
+    _cache_size_refreshing = False
+    _cache_size_pending_result = None
+    _cache_size_generation += 1
     if hasattr(bpy.types.Scene, "gob_sp_ui_export_settings_initialized"):
         del bpy.types.Scene.gob_sp_ui_export_settings_initialized
     if hasattr(bpy.types.Scene, "gob_sp_ui_show_export_settings"):
@@ -3717,5 +4587,7 @@ def unregister():
         del bpy.types.Scene.gob_sp_high_poly_collection
     if hasattr(bpy.types.Scene, "gob_sp_low_poly_collection"):
         del bpy.types.Scene.gob_sp_low_poly_collection
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _shutdown_bridge_pool()
+    _stop_io_worker()
+    clear_sp_exe_cache()
+    _unregister_classes()
@@ -7,6 +7,7 @@ import sys
 import time
 import urllib.error
 import urllib.request
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets, QtNetwork
@@ -91,6 +92,11 @@ _temp_sp_project_file = None
 _temp_blender_file = None
 _last_sp_project_file = None
 _project_dir_cache = {}
+_manifest_index = {}
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_SANITIZE_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if not (chr(code).isalnum() or chr(code) in "-_")}
+)
 _force_new_token = ""
 
 
@@ -193,6 +199,7 @@ CUSTOM_EXPORT_PRESETS.extend([
 ])
 
 
+@lru_cache(maxsize=None)
 def windows_documents_dir():
     if os.name != "nt":
         return None
@@ -211,6 +218,7 @@ def windows_documents_dir():
     return None
 
 
+@lru_cache(maxsize=None)
 def default_bridge_dir():
     env_path = os.environ.get(BRIDGE_ENV_VAR)
     if env_path:
@@ -224,6 +232,7 @@ def default_bridge_dir():
     return os.path.join(os.path.expanduser("~"), "Documents", "GoB_SP_Bridge")
 
 
+@lru_cache(maxsize=None)
 def documents_bridge_root():
     if sys.platform == "darwin":
         icloud_docs = (
@@ -244,22 +253,58 @@ def documents_bridge_root():
     return Path(os.path.expanduser("~")) / "Documents" / "GoB_SP_Bridge"
 
 
+@lru_cache(maxsize=None)
 def bridge_root_hint_path():
     return Path(default_bridge_dir()).expanduser() / BRIDGE_ROOT_HINT_FILENAME
 
 
+@lru_cache(maxsize=None)
 def shared_bridge_root_hint_path():
     return Path.home() / BRIDGE_SHARED_HINT_DIRNAME / BRIDGE_ROOT_HINT_FILENAME
 
 
+def reset_path_caches():
+    for cached in (
+        windows_documents_dir,
+        default_bridge_dir,
+        documents_bridge_root,
+        bridge_root_hint_path,
+        shared_bridge_root_hint_path,
+        settings_path,
+    ):
+        cached.cache_clear()
+
+
+def _read_json_bytes(path):
+    fd = os.open(str(path), os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        while len(data) > size:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return json.loads(data)
+
+
+def _write_json_bytes(path, data):
+    payload = memoryview(json.dumps(data, indent=2, ensure_ascii=True).encode("utf-8"))
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+
+
 def read_bridge_root_hint():
     for path in (bridge_root_hint_path(), shared_bridge_root_hint_path()):
-        if not path.exists():
-            continue
         try:
-            with open(path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (OSError, json.JSONDecodeError):
+            data = _read_json_bytes(path)
+        except (OSError, ValueError):
             continue
         if not isinstance(data, dict):
             continue
@@ -276,12 +321,12 @@ def write_bridge_root_hint(root_path):
     for path in (bridge_root_hint_path(), shared_bridge_root_hint_path()):
         try:
             ensure_dir(path.parent)
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, ensure_ascii=True)
+            _write_json_bytes(path, payload)
         except OSError:
             continue
 
 
+@lru_cache(maxsize=None)
 def settings_path():
     base = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.AppDataLocation)
     if not base:
@@ -289,15 +334,15 @@ def settings_path():
     return Path(base) / SETTINGS_FILENAME
 
 
-def load_settings():
-    path = settings_path()
-    if not path.exists():
-        return {}
+def _load_json_file(path):
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except (OSError, json.JSONDecodeError):
-        return {}
+        return _read_json_bytes(path)
+    except (OSError, ValueError):
+        return None
+
+
+def load_settings():
+    data = _load_json_file(settings_path())
     return data if isinstance(data, dict) else {}
 
 
@@ -305,8 +350,7 @@ def save_settings(data):
     path = settings_path()
     ensure_dir(path.parent)
     try:
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, ensure_ascii=True)
+        _write_json_bytes(path, data)
     except OSError:
         return
 
@@ -371,11 +415,7 @@ def load_project_settings(project_dir=None):
             path = legacy_path
         else:
             return {}
-    try:
-        with open(path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except (OSError, json.JSONDecodeError):
-        return {}
+    data = _load_json_file(path)
     return data if isinstance(data, dict) else {}
 
 
@@ -385,8 +425,7 @@ def save_project_settings(data, project_dir=None):
         return
     ensure_dir(path.parent)
     try:
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, ensure_ascii=True)
+        _write_json_bytes(path, data)
     except OSError:
         return
 
@@ -450,13 +489,9 @@ def save_persistent_state(last_settings=None, user_presets=None, project_dir=Non
 def sanitize_name(name):
     if not name:
         return "untitled"
-    safe = []
-    for ch in name:
-        if ord(ch) < 128 and (ch.isalnum() or ch in "-_"):
-            safe.append(ch)
-        else:
-            safe.append("_")
-    result = "".join(safe).strip("_")
+    if not name.isascii():
+        name = name.encode("ascii", "replace").decode("ascii")
+    result = name.translate(_SANITIZE_TABLE).strip("_")
     return result or "untitled"
 
 
@@ -830,13 +865,9 @@ def link_registry_paths():
 
 def load_link_registry():
     for path in link_registry_paths():
-        if not path or not path.exists():
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (OSError, json.JSONDecodeError):
+        if not path:
             continue
+        data = _load_json_file(path)
         if isinstance(data, dict):
             return data
     return {}
@@ -849,16 +880,14 @@ def save_link_registry(data):
     primary = paths[0]
     ensure_dir(primary.parent)
     try:
-        with open(primary, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, ensure_ascii=True)
+        _write_json_bytes(primary, data)
     except OSError:
         return
     for path in paths[1:]:
         if not path.exists():
             continue
         try:
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, ensure_ascii=True)
+            _write_json_bytes(path, data)
         except OSError:
             continue
 
@@ -899,26 +928,71 @@ def paths_match(left, right):
     return normalize_path(left).lower() == normalize_path(right).lower()
 
 
+def _scan_manifest_root(root_str):
+    try:
+        with os.scandir(root_str) as entries:
+            dir_paths = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return None, []
+    stamp = []
+    found = []
+    for dir_path in [root_str] + dir_paths:
+        for path in (
+            os.path.join(dir_path, PROJECT_META_DIRNAME, MANIFEST_FILENAME),
+            os.path.join(dir_path, MANIFEST_FILENAME),
+        ):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stamp.append((path, stat.st_mtime_ns, stat.st_size))
+            found.append((path, stat.st_mtime))
+    return tuple(stamp), found
+
+
+def manifest_index_for_root(root):
+    root_str = str(root)
+    stamp, found = _scan_manifest_root(root_str)
+    if stamp is None:
+        _manifest_index.pop(root_str, None)
+        return None
+    cached = _manifest_index.get(root_str)
+    if cached and cached["stamp"] == stamp:
+        return cached
+    records = []
+    by_sp = {}
+    for path, mtime in found:
+        manifest = read_manifest(path)
+        if not isinstance(manifest, dict):
+            continue
+        record = (mtime, Path(path), manifest.get("source"))
+        records.append(record)
+        manifest_sp = manifest.get("sp_project_file") or manifest.get("sp_project_path")
+        if manifest_sp:
+            by_sp.setdefault(normalize_path_key(manifest_sp), []).append(record)
+    cached = {"stamp": stamp, "records": records, "by_sp": by_sp}
+    _manifest_index[root_str] = cached
+    return cached
+
+
+def clear_manifest_index():
+    _manifest_index.clear()
+
+
 def find_manifest_for_sp_project(bridge_roots, sp_project_file, source=None):
     if not sp_project_file:
         return None
+    sp_key = normalize_path_key(sp_project_file)
     best_path = None
     best_time = -1.0
     for root in bridge_roots:
-        if not root or not root.exists():
+        if not root:
             continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
-                continue
-            manifest = read_manifest(candidate)
-            if not manifest:
-                continue
-            if source and manifest.get("source") != source:
-                continue
-            manifest_sp = manifest.get("sp_project_file") or manifest.get("sp_project_path")
-            if not manifest_sp or not paths_match(manifest_sp, sp_project_file):
+        index = manifest_index_for_root(root)
+        if not index:
+            continue
+        for mtime, candidate, manifest_source in index["by_sp"].get(sp_key, ()):
+            if source and manifest_source != source:
                 continue
             if mtime > best_time:
                 best_time = mtime
@@ -1176,8 +1250,7 @@ def write_active_sp_info():
     for path in active_sp_info_paths(project_dir):
         ensure_dir(path.parent)
         try:
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(info, handle, indent=2, ensure_ascii=True)
+            _write_json_bytes(path, info)
         except OSError:
             continue
 
@@ -1202,9 +1275,8 @@ def active_blender_info_paths(project_dir=None):
 
 def read_active_blender_info(path):
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except (OSError, json.JSONDecodeError):
+        data = _read_json_bytes(path)
+    except (OSError, ValueError):
         return None
     if not isinstance(data, dict):
         return None
@@ -1260,16 +1332,12 @@ def ensure_dir(path):
 
 
 def write_manifest(path, data):
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
+    _write_json_bytes(path, data)
+    clear_manifest_index()
 
 
 def read_manifest(path):
-    try:
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (OSError, json.JSONDecodeError):
-        return None
+    return _load_json_file(path)
 
 
 def get_candidate_bridge_roots():
@@ -1311,17 +1379,14 @@ def find_latest_manifest(bridge_roots, source=None):
     best_path = None
     best_time = -1.0
     for root in bridge_roots:
-        if not root or not root.exists():
+        if not root:
             continue
-        for candidate in root.rglob(MANIFEST_FILENAME):
-            try:
-                mtime = candidate.stat().st_mtime
-            except OSError:
+        index = manifest_index_for_root(root)
+        if not index:
+            continue
+        for mtime, candidate, manifest_source in index["records"]:
+            if source and manifest_source != source:
                 continue
-            if source:
-                manifest = read_manifest(candidate)
-                if not manifest or manifest.get("source") != source:
-                    continue
             if mtime > best_time:
                 best_time = mtime
                 best_path = candidate
@@ -4884,6 +4949,7 @@ AUTO_IMPORT_ACTIVE_WRITE_INTERVAL = 5.0
 
 def start_plugin():
     global _force_new_token
+    reset_path_caches()
     _force_new_token = load_force_new_token()
     action_import = QtGui.QAction("GoB Bridge: Import from Blender")
     action_import.triggered.connect(import_from_blender)